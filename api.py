@@ -1,11 +1,12 @@
 import hashlib
 import logging
-import math
 import secrets
+import time
 from datetime import datetime, timezone
-from functools import wraps
+from functools import lru_cache, wraps
 
 from flask import Blueprint, jsonify, request
+from sqlalchemy.orm import joinedload
 
 from models import VALID_EVENT_TYPES, ApiToken, Competitor, Division, Match, Ring, db
 
@@ -41,6 +42,31 @@ def _hash_token(raw_token: str) -> str:
     return hashlib.sha256(raw_token.encode()).hexdigest()
 
 
+# --- Ring list cache ---
+
+# Rings change rarely, but every ring dropdown and public ring poll lists them all.
+RING_CACHE_SECONDS = 30
+
+
+@lru_cache(maxsize=1)
+def _cached_rings(epoch):
+    """Return every ring as an ``{"id", "name"}`` dict, cached for the given *epoch*.
+
+    Plain dicts are cached rather than ``Ring`` instances, which would be detached
+    from the session once the request that loaded them ends.
+    """
+    rows = db.session.execute(db.select(Ring.id, Ring.name).order_by(Ring.id))
+    return tuple({"id": ring_id, "name": name} for ring_id, name in rows)
+
+
+def _ring_choices():
+    """Return the cached ring list, refreshed at least every ``RING_CACHE_SECONDS``.
+
+    Routes that create, rename or delete a ring call ``_cached_rings.cache_clear()``.
+    """
+    return _cached_rings(int(time.time() // RING_CACHE_SECONDS))
+
+
 # --- API-specific auth decorator (Bearer token, returns JSON 401, never redirects) ---
 
 
@@ -150,6 +176,7 @@ def api_create_ring():
     new_ring = Ring(name=name)
     db.session.add(new_ring)
     db.session.commit()
+    _cached_rings.cache_clear()
     return success_response({"id": new_ring.id, "name": new_ring.name}, status_code=201)
 
 
@@ -177,6 +204,7 @@ def api_update_ring(ring_id):
             return error_response("BAD_REQUEST", "Ring name is required.", details={"field": "name"}, status_code=400)
         ring.name = new_name
     db.session.commit()
+    _cached_rings.cache_clear()
     return success_response({"id": ring.id, "name": ring.name})
 
 
@@ -188,6 +216,7 @@ def api_delete_ring(ring_id):
         return error_response("NOT_FOUND", f"Ring {ring_id} not found.", status_code=404)
     db.session.delete(ring)
     db.session.commit()
+    _cached_rings.cache_clear()
     return success_response({"id": ring_id, "deleted": True})
 
 
@@ -305,16 +334,98 @@ def api_get_bracket(div_id):
     return success_response(bracket_data)
 
 
+# Named rounds keyed by the number of matches in the round; larger rounds are "Round of N"
+_ROUND_NAMES = {1: "Final", 2: "Semi-Final", 4: "Quarter-Final"}
+
+
 def _get_round_name(num_matches):
     """Return the standard tournament round name for a round with *num_matches* matches."""
-    if num_matches == 1:
-        return "Final"
-    elif num_matches == 2:
-        return "Semi-Final"
-    elif num_matches == 4:
-        return "Quarter-Final"
-    else:
-        return f"Round of {num_matches * 2}"
+    return _ROUND_NAMES.get(num_matches) or f"Round of {num_matches * 2}"
+
+
+def _build_bracket(div_id, competitor_ids):
+    """Insert a single-elimination bracket for *competitor_ids* and return the number of matches created.
+
+    Competitor IDs are dealt into first-round slots in the given (roster) order and
+    bye slots are auto-completed, with their winners pushed into the next round.
+    Each round goes out as one multi-row ``INSERT ... RETURNING`` and the previous
+    round's ``next_match_id`` links are set with one executemany ``UPDATE``, so the
+    whole bracket costs O(log N) round-trips.  The caller owns the transaction.
+    """
+    # 1. Calculate bracket size (next power of 2) with exact integer bit arithmetic
+    # For N >= 2 competitors, Next Power = 1 << bit_length(N - 1)
+    next_power_of_2 = 1 << (len(competitor_ids) - 1).bit_length()
+    num_first_round_matches = next_power_of_2 // 2
+
+    # 2. Distribute competitors into bracket slots in roster order
+    match_pairings = [[None, None] for _ in range(num_first_round_matches)]
+
+    # Deal competitors into the pairings like a deck of cards
+    for i, competitor_id in enumerate(competitor_ids):
+        slot = i // num_first_round_matches  # 0 for first pass, 1 for second pass
+        match_index = i % num_first_round_matches
+        match_pairings[match_index][slot] = competitor_id
+
+    # 3. Create first-round matches, named by bracket size (e.g. "Quarter-Final", "Round of 16").
+    # Every row carries the same keys so the whole round goes out as a single multi-row INSERT.
+    first_round_name = _get_round_name(num_first_round_matches)
+    prev_round_rows = []
+    for pair in match_pairings:
+        comp1, comp2 = pair[0], pair[1]
+        row = {
+            "division_id": div_id,
+            "competitor1_id": comp1,
+            "competitor2_id": comp2,
+            "winner_id": None,
+            "status": "Pending",
+            "round_name": first_round_name,
+        }
+
+        # Auto-advance if it's a bye
+        if comp1 and not comp2:
+            row["winner_id"] = comp1
+            row["status"] = "Completed (Bye)"
+        elif comp2 and not comp1:
+            row["winner_id"] = comp2
+            row["status"] = "Completed (Bye)"
+
+        prev_round_rows.append(row)
+
+    # Insert the round in one statement; RETURNING hands back the new IDs in row order
+    insert_stmt = db.insert(Match).returning(Match.id, sort_by_parameter_order=True)
+    prev_round_ids = db.session.execute(insert_stmt, prev_round_rows).scalars().all()
+    matches_created = len(prev_round_ids)
+
+    # 4. Build Subsequent Rounds (Bottom-Up to the Final), one INSERT per round
+    while len(prev_round_ids) > 1:
+        # Determine round naming based on number of matches being created
+        r_name = _get_round_name(len(prev_round_ids) // 2)
+
+        # Group the previous round's matches in pairs, pushing forward winners of byes immediately
+        next_round_rows = [
+            {
+                "division_id": div_id,
+                "competitor1_id": prev_round_rows[i]["winner_id"],
+                "competitor2_id": prev_round_rows[i + 1]["winner_id"],
+                "winner_id": None,
+                "status": "Pending",
+                "round_name": r_name,
+            }
+            for i in range(0, len(prev_round_rows), 2)
+        ]
+        next_round_ids = db.session.execute(insert_stmt, next_round_rows).scalars().all()
+        matches_created += len(next_round_ids)
+
+        # Link the previous matches to the new ones with a single executemany UPDATE by primary key
+        db.session.execute(
+            db.update(Match),
+            [{"id": match_id, "next_match_id": next_round_ids[i // 2]} for i, match_id in enumerate(prev_round_ids)],
+        )
+
+        prev_round_rows = next_round_rows
+        prev_round_ids = next_round_ids
+
+    return matches_created
 
 
 @api_v1.route("/divisions/<int:div_id>/generate_bracket", methods=["POST"])
@@ -338,8 +449,11 @@ def api_generate_bracket(div_id):
     Match.query.filter_by(division_id=div_id).delete()
     db.session.flush()
 
-    competitors = Competitor.query.filter_by(division_id=div_id).order_by(Competitor.position).all()
-    num_comp = len(competitors)
+    # Only the IDs are needed to build the bracket, so skip hydrating Competitor objects
+    competitor_ids = db.session.scalars(
+        db.select(Competitor.id).filter_by(division_id=div_id).order_by(Competitor.position)
+    ).all()
+    num_comp = len(competitor_ids)
     if num_comp < 2:
         db.session.rollback()
         return error_response(
@@ -348,59 +462,7 @@ def api_generate_bracket(div_id):
             status_code=400,
         )
 
-    # Calculate bracket size (next power of 2)
-    next_power_of_2 = 2 ** math.ceil(math.log2(num_comp))
-    num_first_round_matches = next_power_of_2 // 2
-
-    # Distribute competitors into bracket slots in roster order
-    match_pairings = [[None, None] for _ in range(num_first_round_matches)]
-    for i, competitor in enumerate(competitors):
-        slot = i // num_first_round_matches
-        match_index = i % num_first_round_matches
-        match_pairings[match_index][slot] = competitor
-
-    # Create first-round matches
-    first_round_name = _get_round_name(num_first_round_matches)
-    current_round_matches = []
-    for pair in match_pairings:
-        comp1, comp2 = pair[0], pair[1]
-        match = Match(
-            division_id=div_id,
-            competitor1_id=comp1.id if comp1 else None,
-            competitor2_id=comp2.id if comp2 else None,
-            round_name=first_round_name,
-        )
-        if comp1 and not comp2:
-            match.winner_id = comp1.id
-            match.status = "Completed (Bye)"
-        elif comp2 and not comp1:
-            match.winner_id = comp2.id
-            match.status = "Completed (Bye)"
-        db.session.add(match)
-        current_round_matches.append(match)
-
-    db.session.flush()
-
-    # Build subsequent rounds bottom-up to the Final
-    matches_created = len(current_round_matches)
-    while len(current_round_matches) > 1:
-        next_round_matches = []
-        for i in range(0, len(current_round_matches), 2):
-            prev_match1 = current_round_matches[i]
-            prev_match2 = current_round_matches[i + 1]
-            r_name = _get_round_name(len(current_round_matches) // 2)
-            new_match = Match(division_id=div_id, round_name=r_name)
-            db.session.add(new_match)
-            db.session.flush()
-            prev_match1.next_match_id = new_match.id
-            prev_match2.next_match_id = new_match.id
-            if prev_match1.winner_id:
-                new_match.competitor1_id = prev_match1.winner_id
-            if prev_match2.winner_id:
-                new_match.competitor2_id = prev_match2.winner_id
-            next_round_matches.append(new_match)
-            matches_created += 1
-        current_round_matches = next_round_matches
+    matches_created = _build_bracket(div_id, competitor_ids)
 
     db.session.commit()
     return success_response(
@@ -757,7 +819,7 @@ def api_update_match(match_id):
 @api_v1.route("/matches/<int:match_id>/result", methods=["POST"])
 @api_login_required
 def api_record_result(match_id):
-    match = db.session.get(Match, match_id)
+    match = db.session.get(Match, match_id, options=[joinedload(Match.next_match)])
     if not match:
         return error_response("NOT_FOUND", f"Match {match_id} not found.", status_code=404)
 
@@ -794,8 +856,8 @@ def api_record_result(match_id):
     match.status = status
     match.winner_id = winner_id
 
-    if match.next_match_id:
-        next_match = db.session.get(Match, match.next_match_id)
+    next_match = match.next_match
+    if next_match:
         if not next_match.competitor1_id:
             next_match.competitor1_id = winner_id
         elif not next_match.competitor2_id:
@@ -10,6 +10,7 @@ from dotenv import load_dotenv
 from flask import (
     Flask,
     Response,
+    abort,
     jsonify,
     make_response,
     redirect,
@@ -27,7 +28,7 @@ from sqlalchemy.orm import joinedload
 from supabase import create_client
 from supabase_auth.errors import AuthApiError
 
-from api import _generate_raw_token, _hash_token, api_v1
+from api import _build_bracket, _cached_rings, _generate_raw_token, _hash_token, _ring_choices, api_v1
 from models import COMPLETED_MATCH_STATUSES, VALID_EVENT_TYPES, ApiToken, Competitor, Division, Match, Ring, Score, db
 
 # Fetch variables
@@ -107,6 +108,7 @@ def manage_rings():
         new_ring = Ring(name=data["name"])
         db.session.add(new_ring)
         db.session.commit()
+        _cached_rings.cache_clear()
         return jsonify({"message": "Ring created", "id": new_ring.id}), 201
 
     rings = Ring.query.all()
@@ -137,7 +139,7 @@ def manage_divisions():
 @deprecated_route
 @login_required
 def edit_division(div_id):
-    division = Division.query.get_or_404(div_id)
+    division = db.get_or_404(Division, div_id)
     if request.method == "DELETE":
         db.session.delete(division)
         db.session.commit()
@@ -154,23 +156,25 @@ def edit_division(div_id):
 @deprecated_route
 @login_required
 def record_result(match_id):
-    match = Match.query.get_or_404(match_id)
+    match = db.get_or_404(Match, match_id, options=[joinedload(Match.next_match)])
     data = request.json
 
     status = data.get("status")  # 'Completed' or 'Disqualification'
     winner_id = data.get("winner_id")
 
+    # Validate before touching the match so a rejected request leaves nothing to flush
+    if status in ["Completed", "Disqualification"] and not winner_id:
+        db.session.rollback()
+        return jsonify({"error": "Winner ID required for Completed/DQ matches"}), 400
+
     match.status = status
 
     if status in ["Completed", "Disqualification"]:
-        if not winner_id:
-            return jsonify({"error": "Winner ID required for Completed/DQ matches"}), 400
-
         match.winner_id = winner_id
 
         # --- BRACKET ADVANCEMENT LOGIC ---
-        if match.next_match_id:
-            next_match = db.session.get(Match, match.next_match_id)
+        next_match = match.next_match
+        if next_match:
             # Assign the winner to the next match's open slot
             if not next_match.competitor1_id:
                 next_match.competitor1_id = winner_id
@@ -197,105 +201,27 @@ def _scorekeeper_match_card_html(match):
     return render_template("scorekeeper_match_card.html", match=match)
 
 
-def _get_round_name(num_matches):
-    """Return the standard tournament round name for a round with *num_matches* matches."""
-    if num_matches == 1:
-        return "Final"
-    elif num_matches == 2:
-        return "Semi-Final"
-    elif num_matches == 4:
-        return "Quarter-Final"
-    else:
-        return f"Round of {num_matches * 2}"
-
-
 # DEPRECATED — use /api/v1/divisions/<id>/generate_bracket
 @app.route("/divisions/<int:div_id>/generate_bracket", methods=["POST"])
 @deprecated_route
 @login_required
 def generate_bracket(div_id):
-    Division.query.get_or_404(div_id)
+    db.get_or_404(Division, div_id)
     # Delete any existing matches before (re-)generating the bracket
     Match.query.filter_by(division_id=div_id).delete()
     db.session.flush()
 
-    competitors = Competitor.query.filter_by(division_id=div_id).order_by(Competitor.position).all()
+    # Only the IDs are needed to build the bracket, so skip hydrating Competitor objects
+    competitor_ids = db.session.scalars(
+        db.select(Competitor.id).filter_by(division_id=div_id).order_by(Competitor.position)
+    ).all()
 
-    num_comp = len(competitors)
+    num_comp = len(competitor_ids)
     if num_comp < 2:
         db.session.rollback()
         return jsonify({"error": "Need at least 2 competitors to generate a bracket."}), 400
 
-    # 1. Calculate bracket size (next power of 2) using log2
-    # For N competitors, Next Power = 2^ceil(log2(N))
-    next_power_of_2 = 2 ** math.ceil(math.log2(num_comp))
-    num_first_round_matches = next_power_of_2 // 2
-
-    # 2. Distribute competitors into bracket slots in roster order
-    match_pairings = [[None, None] for _ in range(num_first_round_matches)]
-
-    # Deal competitors into the pairings like a deck of cards
-    for i, competitor in enumerate(competitors):
-        slot = i // num_first_round_matches  # 0 for first pass, 1 for second pass
-        match_index = i % num_first_round_matches
-        match_pairings[match_index][slot] = competitor
-
-    # 3. Create first-round matches, named by bracket size (e.g. "Quarter-Final", "Round of 16")
-    first_round_name = _get_round_name(num_first_round_matches)
-    current_round_matches = []
-    for pair in match_pairings:
-        comp1, comp2 = pair[0], pair[1]
-
-        match = Match(
-            division_id=div_id,
-            competitor1_id=comp1.id if comp1 else None,
-            competitor2_id=comp2.id if comp2 else None,
-            round_name=first_round_name,
-        )
-
-        # Auto-advance if it's a bye
-        if comp1 and not comp2:
-            match.winner_id = comp1.id
-            match.status = "Completed (Bye)"
-        elif comp2 and not comp1:
-            match.winner_id = comp2.id
-            match.status = "Completed (Bye)"
-
-        db.session.add(match)
-        current_round_matches.append(match)
-
-    # Flush to the database to generate the IDs for these new matches
-    db.session.flush()
-
-    # 4. Build Subsequent Rounds (Bottom-Up to the Final)
-    while len(current_round_matches) > 1:
-        next_round_matches = []
-
-        # Group the previous round's matches in pairs
-        for i in range(0, len(current_round_matches), 2):
-            prev_match1 = current_round_matches[i]
-            prev_match2 = current_round_matches[i + 1]
-
-            # Determine round naming based on number of matches being created
-            r_name = _get_round_name(len(current_round_matches) // 2)
-
-            new_match = Match(division_id=div_id, round_name=r_name)
-            db.session.add(new_match)
-            db.session.flush()  # Get the ID for the new match
-
-            # Link the previous matches to this new one
-            prev_match1.next_match_id = new_match.id
-            prev_match2.next_match_id = new_match.id
-
-            # Push forward winners of byes immediately
-            if prev_match1.winner_id:
-                new_match.competitor1_id = prev_match1.winner_id
-            if prev_match2.winner_id:
-                new_match.competitor2_id = prev_match2.winner_id
-
-            next_round_matches.append(new_match)
-
-        current_round_matches = next_round_matches
+    _build_bracket(div_id, competitor_ids)
 
     # Commit everything to the database
     db.session.commit()
@@ -313,12 +239,19 @@ def get_bracket(div_id):
     if not matches:
         return jsonify({"error": "No bracket found for this division."}), 404
 
+    # Load the division's competitor names in one query instead of one lookup per match slot
+    comp_map = {
+        comp_id: {"id": comp_id, "name": name}
+        for comp_id, name in db.session.execute(
+            db.select(Competitor.id, Competitor.name).filter_by(division_id=div_id)
+        )
+    }
+
     # Helper function to grab competitor names easily
     def get_comp_data(comp_id):
         if not comp_id:
             return None
-        comp = db.session.get(Competitor, comp_id)
-        return {"id": comp.id, "name": comp.name} if comp else None
+        return comp_map.get(comp_id)
 
     bracket_data = []
     for match in matches:
@@ -582,7 +515,7 @@ def public_schedule_view():
 
 @app.route("/ui/divisions/<int:div_id>/bracket", methods=["GET"])
 def brack(div_id):
-    division = Division.query.get_or_404(div_id)
+    division = db.get_or_404(Division, div_id)
     return render_template("bracket_view.html", division=division)
 
 
@@ -652,15 +585,21 @@ def _build_bracket_display(matches):
 @app.route("/divisions/<int:div_id>/bracket_ui", methods=["GET"])
 @deprecated_route
 def get_bracket_ui(div_id):
-    matches = Match.query.filter_by(division_id=div_id).order_by(Match.id).all()
+    # Eager-load both competitors so the whole bracket renders from a single query
+    matches = (
+        Match.query.options(joinedload(Match.competitor1), joinedload(Match.competitor2))
+        .filter_by(division_id=div_id)
+        .order_by(Match.id)
+        .all()
+    )
 
     if not matches:
         return render_template("_bracket_empty.html"), 404
 
     # Enrich matches with competitor names for template rendering
     for match in matches:
-        match.competitor1_name = db.session.get(Competitor, match.competitor1_id).name if match.competitor1_id else "TBD"
-        match.competitor2_name = db.session.get(Competitor, match.competitor2_id).name if match.competitor2_id else "TBD"
+        match.competitor1_name = match.competitor1.name if match.competitor1 else "TBD"
+        match.competitor2_name = match.competitor2.name if match.competitor2 else "TBD"
 
     # Build symmetric bracket columns
     columns = _build_bracket_display(matches)
@@ -711,6 +650,39 @@ def _abbrev_round(round_name):
     return round_name
 
 
+def _short_name(competitor):
+    """Return a compact display name such as 'A. Smith', or 'TBD' when the slot is empty."""
+    if competitor is None:
+        return "TBD"
+    parts = competitor.name.split()
+    return f"{parts[0][0]}. {parts[-1]}"
+
+
+def _public_match_view(match):
+    """Return a plain dict describing *match* for the public ring display.
+
+    Building a view keeps display-only labels off the ORM instance, so rendering
+    never dirties the session.
+    """
+
+    def _result(competitor_id):
+        if not match.winner_id:
+            return "-"
+        return "W" if match.winner_id == competitor_id else "L"
+
+    return {
+        "match_number": match.match_number,
+        "division_id": match.division_id,
+        "division_name": match.division.name,
+        "round_short": _abbrev_round(match.round_name),
+        "comp_1": _short_name(match.competitor1),
+        "comp_2": _short_name(match.competitor2),
+        "comp_1_result": _result(match.competitor1_id),
+        "comp_2_result": _result(match.competitor2_id),
+        "status": match.status,
+    }
+
+
 def _compute_placements(matches):
     """Return medal placements dict when the championship match is complete, else None.
 
@@ -767,82 +739,93 @@ def ui_public_rings():
     if event_type not in VALID_EVENT_TYPES:
         return "Invalid event type.", 400
 
-    rings = Ring.query.all()
+    rings = _ring_choices()
+    ring_ids = [ring["id"] for ring in rings]
     completed_statuses = ["Completed", "Completed (Bye)", "Disqualification"]
-    # Find active/upcoming matches for each ring
-    ring_data = []
-    for ring in rings:
-        # Fetch the most recently completed match (by match_number) for this ring
-        last_completed = (
-            Match.query.filter(
-                Match.ring_id == ring.id,
-                Match.division.has(event_type=event_type),
-                Match.status.in_(completed_statuses),
-                Match.match_number.isnot(None),
-            )
-            .order_by(Match.match_number.desc())
-            .first()
+    match_options = (
+        joinedload(Match.competitor1),
+        joinedload(Match.competitor2),
+        joinedload(Match.division),
+    )
+
+    # Fetch the most recently completed match (by match_number) for every ring in one query
+    completed_filters = (
+        Match.ring_id.in_(ring_ids),
+        Match.division.has(event_type=event_type),
+        Match.status.in_(completed_statuses),
+        Match.match_number.isnot(None),
+    )
+    latest_per_ring = (
+        db.select(Match.ring_id, db.func.max(Match.match_number)).where(*completed_filters).group_by(Match.ring_id)
+    )
+    last_completed_by_ring = {
+        m.ring_id: m
+        for m in Match.query.options(*match_options).filter(
+            *completed_filters, db.tuple_(Match.ring_id, Match.match_number).in_(latest_per_ring)
         )
-        if last_completed:
-            last_completed.comp_1 = (
-                f"{last_completed.competitor1.name.split()[0][0]}. {last_completed.competitor1.name.split()[-1]}"
-                if last_completed.competitor1
-                else "TBD"
-            )
-            last_completed.comp_2 = (
-                f"{last_completed.competitor2.name.split()[0][0]}. {last_completed.competitor2.name.split()[-1]}"
-                if last_completed.competitor2
-                else "TBD"
-            )
-            last_completed.comp_1_result = (
-                "W" if last_completed.winner_id == last_completed.competitor1_id else ("L" if last_completed.winner_id else "-")
-            )
-            last_completed.comp_2_result = (
-                "W" if last_completed.winner_id == last_completed.competitor2_id else ("L" if last_completed.winner_id else "-")
-            )
-            last_completed.round_short = _abbrev_round(last_completed.round_name)
-
-        matches = (
-            Match.query.filter(
-                Match.ring_id == ring.id,
-                Match.division.has(event_type=event_type),
-                Match.status.in_(["Pending", "In Progress"]),
-                Match.match_number.isnot(None),
+    }
+
+    # Fetch the first 4 active/upcoming matches of every ring in one query: In Progress first,
+    # then by match_number.  The per-ring cap is applied in SQL with ROW_NUMBER().
+    active_order = (case((Match.status == "In Progress", 0), else_=1), Match.match_number)
+    ranked_active = (
+        db.select(Match.id, db.func.row_number().over(partition_by=Match.ring_id, order_by=active_order).label("ring_rank"))
+        .where(
+            Match.ring_id.in_(ring_ids),
+            Match.division.has(event_type=event_type),
+            Match.is_active(),
+            Match.match_number.isnot(None),
+        )
+        .subquery()
+    )
+    active_matches_by_ring = defaultdict(list)
+    active_matches = (
+        Match.query.options(*match_options)
+        .join(ranked_active, Match.id == ranked_active.c.id)
+        .filter(ranked_active.c.ring_rank <= 4)
+        .order_by(Match.ring_id, *active_order)
+        .all()
+    )
+    for match in active_matches:
+        active_matches_by_ring[match.ring_id].append(match)
+
+    # Group and un-configured poomsae divisions for every ring (poomsae tab only)
+    poomsae_divisions_by_ring = defaultdict(list)
+    if event_type == "poomsae":
+        poomsae_divisions = (
+            Division.query.filter(
+                Division.ring_id.in_(ring_ids),
+                Division.event_type == "poomsae",
+                db.or_(Division.poomsae_style != "bracket", Division.poomsae_style.is_(None)),
             )
-            .order_by(case((Match.status == "In Progress", 0), else_=1), Match.match_number)
-            .limit(4)
+            .order_by(Division.id)
             .all()
         )
-        for match in matches:
-            match.comp_1 = (
-                f"{match.competitor1.name.split()[0][0]}. {match.competitor1.name.split()[-1]}" if match.competitor1 else "TBD"
-            )
-            match.comp_2 = (
-                f"{match.competitor2.name.split()[0][0]}. {match.competitor2.name.split()[-1]}" if match.competitor2 else "TBD"
-            )
-            match.round_short = _abbrev_round(match.round_name)
+        for division in poomsae_divisions:
+            poomsae_divisions_by_ring[division.ring_id].append(division)
 
-        ring_data.append({"name": ring.name, "last_completed": last_completed, "matches": matches})
+    ring_data = []
+    for ring in rings:
+        last_completed = last_completed_by_ring.get(ring["id"])
+        if last_completed:
+            last_completed = _public_match_view(last_completed)
+
+        matches = [_public_match_view(match) for match in active_matches_by_ring[ring["id"]]]
+
+        ring_data.append({"name": ring["name"], "last_completed": last_completed, "matches": matches})
 
         # For poomsae tab: merge bracket matches and group divisions into a single
         # interleaved list sorted by their common ring sequence number.
         if event_type == "poomsae":
+            ring_divisions = poomsae_divisions_by_ring[ring["id"]]
+
             # Find the most recently completed group/unconfigured poomsae division for this ring.
-            last_completed_group_div = (
-                Division.query.filter(
-                    Division.ring_id == ring.id,
-                    Division.event_type == "poomsae",
-                    db.or_(Division.poomsae_style != "bracket", Division.poomsae_style.is_(None)),
-                    Division.event_status == "Completed",
-                    Division.ring_sequence.isnot(None),
-                )
-                .order_by(Division.ring_sequence.desc())
-                .first()
-            )
+            completed_group_divs = [d for d in ring_divisions if d.event_status == "Completed" and d.ring_sequence is not None]
+            last_completed_group_div = max(completed_group_divs, key=lambda d: d.ring_sequence, default=None)
 
             # Determine the overall last completed poomsae event (bracket match vs group division).
             # match_number encodes ring_id * 100 + sequence; use % 100 to recover the sequence.
-            bracket_seq = (last_completed.match_number % 100) if (last_completed and last_completed.match_number) else -1
+            bracket_seq = (last_completed["match_number"] % 100) if (last_completed and last_completed["match_number"]) else -1
             group_seq = last_completed_group_div.ring_sequence if last_completed_group_div else -1
             if group_seq > bracket_seq:
                 poomsae_last_completed = {"kind": "division", "obj": last_completed_group_div}
@@ -855,16 +838,11 @@ def ui_public_rings():
             ring_data[-1]["last_completed"] = None
 
             # Show group and un-configured poomsae divisions (exclude Completed); bracket ones appear via matches.
-            group_divisions = Division.query.filter(
-                Division.ring_id == ring.id,
-                Division.event_type == "poomsae",
-                db.or_(Division.poomsae_style != "bracket", Division.poomsae_style.is_(None)),
-                Division.event_status != "Completed",
-            ).all()
+            group_divisions = [d for d in ring_divisions if d.event_status != "Completed"]
             # Build unified items: (sequence, type, object)
             poomsae_items = []
             for m in matches:
-                seq = (m.match_number % 100) if m.match_number else None
+                seq = (m["match_number"] % 100) if m["match_number"] else None
                 poomsae_items.append({"seq": seq, "kind": "match", "obj": m})
             for d in group_divisions:
                 poomsae_items.append({"seq": d.ring_sequence, "kind": "division", "obj": d})
@@ -873,7 +851,7 @@ def ui_public_rings():
             # Limit to 1 In Progress + 3 Pending (mirrors the bracket .limit(4) logic),
             # while preserving the sequence-based ordering established above.
             def _get_item_status(item):
-                return item["obj"].status if item["kind"] == "match" else item["obj"].event_status
+                return item["obj"]["status"] if item["kind"] == "match" else item["obj"].event_status
 
             in_progress_count = 0
             pending_count = 0
@@ -963,6 +941,7 @@ def ui_add_ring():
     new_ring = Ring(name=name)
     db.session.add(new_ring)
     db.session.commit()
+    _cached_rings.cache_clear()
 
     return render_template("_ring_list_item.html", ring=new_ring, include_scorekeeper=False)
 
@@ -977,9 +956,10 @@ def ui_rings_list():
 @app.route("/ui/rings/<int:ring_id>", methods=["DELETE"])
 @login_required
 def ui_delete_ring(ring_id):
-    ring = Ring.query.get_or_404(ring_id)
+    ring = db.get_or_404(Ring, ring_id)
     db.session.delete(ring)
     db.session.commit()
+    _cached_rings.cache_clear()
     # Return an empty string. HTMX will swap the <li> with this empty string, effectively removing it.
     return ""
 
@@ -1017,14 +997,18 @@ def ui_divisions_list():
 @app.route("/ui/divisions/<int:div_id>", methods=["DELETE"])
 @login_required
 def ui_delete_division(div_id):
-    div = Division.query.get_or_404(div_id)
-
-    # Delete all associated scores, matches and competitors first to maintain database integrity
-    Score.query.filter_by(division_id=div_id).delete()
-    Match.query.filter_by(division_id=div_id).delete()
-    Competitor.query.filter_by(division_id=div_id).delete()
-
-    db.session.delete(div)
+    # Delete all associated scores, matches and competitors first to maintain database integrity.
+    # The division itself is deleted and committed straight after, so there is no need for the
+    # session to reconcile these bulk deletes against objects in its identity map.
+    Score.query.filter_by(division_id=div_id).delete(synchronize_session=False)
+    Match.query.filter_by(division_id=div_id).delete(synchronize_session=False)
+    Competitor.query.filter_by(division_id=div_id).delete(synchronize_session=False)
+
+    # Delete the division directly; the affected row count doubles as the existence check
+    result = db.session.execute(db.delete(Division).where(Division.id == div_id))
+    if result.rowcount == 0:
+        db.session.rollback()
+        abort(404)
     db.session.commit()
     return ""
 
@@ -1032,7 +1016,7 @@ def ui_delete_division(div_id):
 @app.route("/admin/divisions/<int:div_id>/setup")
 @login_required
 def admin_division_setup(div_id):
-    division = Division.query.get_or_404(div_id)
+    division = db.get_or_404(Division, div_id)
     return render_template("division_setup.html", division=division)
 
 
@@ -1047,9 +1031,15 @@ def ui_add_competitors(div_id):
 
         # Assign positions starting after the current maximum
         max_pos = db.session.query(db.func.max(Competitor.position)).filter_by(division_id=div_id).scalar() or 0
-        for i, name in enumerate(name_list):
-            comp = Competitor(name=name, division_id=div_id, position=max_pos + i + 1)
-            db.session.add(comp)
+        if name_list:
+            # One executemany INSERT rather than building and flushing an ORM object per name
+            db.session.execute(
+                db.insert(Competitor),
+                [
+                    {"name": name, "division_id": div_id, "position": max_pos + i + 1}
+                    for i, name in enumerate(name_list)
+                ],
+            )
 
         db.session.commit()
 
@@ -1065,15 +1055,15 @@ def ui_competitors_list(div_id):
 @app.route("/ui/divisions/<int:div_id>/bracket_controls")
 @login_required
 def ui_bracket_controls(div_id):
-    division = Division.query.get_or_404(div_id)
-    rings = Ring.query.all()
+    division = db.get_or_404(Division, div_id)
+    rings = _ring_choices()
     return render_template("_bracket_controls.html", division=division, rings=rings)
 
 
 @app.route("/ui/divisions/<int:div_id>/competitors/<int:comp_id>", methods=["DELETE"])
 @login_required
 def ui_delete_competitor(div_id, comp_id):
-    comp = Competitor.query.get_or_404(comp_id)
+    comp = db.get_or_404(Competitor, comp_id)
     if comp.division_id != div_id:
         return "Not found", 404
     # Clear any existing bracket matches so FK constraints are not violated and
@@ -1111,21 +1101,21 @@ def ui_move_competitor(div_id, comp_id):
 @app.route("/ui/divisions/<int:div_id>/name_form")
 @login_required
 def ui_division_name_form(div_id):
-    division = Division.query.get_or_404(div_id)
+    division = db.get_or_404(Division, div_id)
     return render_template("_division_name_form.html", division=division)
 
 
 @app.route("/ui/divisions/<int:div_id>/name_display")
 @login_required
 def ui_division_name_display(div_id):
-    division = Division.query.get_or_404(div_id)
+    division = db.get_or_404(Division, div_id)
     return _division_name_display_html(division)
 
 
 @app.route("/ui/divisions/<int:div_id>/name", methods=["PATCH"])
 @login_required
 def ui_rename_division(div_id):
-    division = Division.query.get_or_404(div_id)
+    division = db.get_or_404(Division, div_id)
     new_name = request.form.get("name", "").strip()
     if new_name:
         division.name = new_name
@@ -1136,9 +1126,9 @@ def ui_rename_division(div_id):
 @app.route("/admin/divisions/<int:div_id>/bracket_manage")
 @login_required
 def manage_bracket_page(div_id):
-    division = Division.query.get_or_404(div_id)
+    division = db.get_or_404(Division, div_id)
     matches = Match.query.filter_by(division_id=div_id).all()
-    rings = Ring.query.all()
+    rings = _ring_choices()
 
     # Group matches by round, then sort rounds earliest-first (most matches → fewest)
     grouped_matches = defaultdict(list)
@@ -1146,7 +1136,7 @@ def manage_bracket_page(div_id):
         grouped_matches[match.round_name].append(match)
 
     sorted_rounds = dict(sorted(grouped_matches.items(), key=lambda x: _round_sort_key(x[0]), reverse=True))
-    current_ring = Ring.query.get(division.ring_id) if division.ring_id else None
+    current_ring = db.session.get(Ring, division.ring_id) if division.ring_id else None
 
     return render_template("bracket_manage.html", division=division, rounds=sorted_rounds, rings=rings, current_ring=current_ring)
 
@@ -1154,7 +1144,7 @@ def manage_bracket_page(div_id):
 @app.route("/ui/divisions/<int:div_id>/bracket_ring", methods=["PATCH"])
 @login_required
 def ui_bracket_ring_assignment(div_id):
-    division = Division.query.get_or_404(div_id)
+    division = db.get_or_404(Division, div_id)
     ring_id_raw = request.form.get("ring_id", "")
     if ring_id_raw == "":
         new_ring_id = None
@@ -1163,7 +1153,7 @@ def ui_bracket_ring_assignment(div_id):
             new_ring_id = int(ring_id_raw)
         except ValueError:
             return "Invalid ring_id value.", 400
-        if Ring.query.get(new_ring_id) is None:
+        if db.session.get(Ring, new_ring_id) is None:
             return "Ring not found.", 404
 
     # When ring changes, clear scheduling for all matches in this division
@@ -1174,8 +1164,8 @@ def ui_bracket_ring_assignment(div_id):
 
     division.ring_id = new_ring_id
     db.session.commit()
-    rings = Ring.query.all()
-    current_ring = Ring.query.get(division.ring_id) if division.ring_id else None
+    rings = _ring_choices()
+    current_ring = db.session.get(Ring, division.ring_id) if division.ring_id else None
     return render_template(
         "_bracket_ring_assignment.html",
         division=division,
@@ -1189,7 +1179,7 @@ def ui_bracket_ring_assignment(div_id):
 @deprecated_route
 @login_required
 def schedule_match_htmx(match_id):
-    match = Match.query.get_or_404(match_id)
+    match = db.get_or_404(Match, match_id)
 
     ring_sequence = request.form.get("ring_sequence")  # e.g., the '25' in 525
 
@@ -1260,7 +1250,7 @@ def schedule_match_htmx(match_id):
 @app.route("/ring/<int:ring_id>/scorekeeper")
 @login_required
 def ring_scorekeeper(ring_id):
-    ring = Ring.query.get_or_404(ring_id)
+    ring = db.get_or_404(Ring, ring_id)
     event_type = request.args.get("event_type", "kyorugi")
     if event_type not in VALID_EVENT_TYPES:
         return "Invalid event type.", 400
@@ -1270,7 +1260,7 @@ def ring_scorekeeper(ring_id):
         Match.query.filter(
             Match.ring_id == ring.id,
             Match.division.has(event_type=event_type),
-            Match.status.in_(["Pending", "In Progress"]),
+            Match.is_active(),
         )
         .order_by(Match.match_number)
         .all()
@@ -1283,12 +1273,12 @@ def ring_scorekeeper(ring_id):
 @login_required
 def ui_scorekeeper_matches(ring_id):
     """HTMX fragment: pending/in-progress kyorugi matches for a ring, ordered by match number."""
-    Ring.query.get_or_404(ring_id)
+    db.get_or_404(Ring, ring_id)
     matches = (
         Match.query.filter(
             Match.ring_id == ring_id,
             Match.division.has(event_type="kyorugi"),
-            Match.status.in_(["Pending", "In Progress"]),
+            Match.is_active(),
         )
         .order_by(Match.match_number)
         .all()
@@ -1299,7 +1289,17 @@ def ui_scorekeeper_matches(ring_id):
 @app.route("/ui/matches/<int:match_id>/result", methods=["POST"])
 @login_required
 def ui_record_result(match_id):
-    match = Match.query.get_or_404(match_id)
+    # Load the division, next match and both competitors up front so recording a result is a single SELECT
+    match = db.get_or_404(
+        Match,
+        match_id,
+        options=[
+            joinedload(Match.division),
+            joinedload(Match.next_match),
+            joinedload(Match.competitor1),
+            joinedload(Match.competitor2),
+        ],
+    )
 
     if not match.competitor1_id or not match.competitor2_id:
         return render_template(
@@ -1331,6 +1331,7 @@ def ui_record_result(match_id):
 
     if status in ["Completed", "Disqualification"]:
         if not winner_id:
+            db.session.rollback()
             return render_template("_inline_error.html", message="Error: Winner must be selected."), 400
 
         match.status = status
@@ -1341,22 +1342,30 @@ def ui_record_result(match_id):
             match.end_time = datetime.now(timezone.utc)
 
         # --- BRACKET ADVANCEMENT LOGIC ---
-        if match.next_match_id:
-            next_match = db.session.get(Match, match.next_match_id)
+        next_match = match.next_match
+        if next_match:
             # Push the winner into the next match's open slot
             if not next_match.competitor1_id:
                 next_match.competitor1_id = match.winner_id
             elif not next_match.competitor2_id:
                 next_match.competitor2_id = match.winner_id
 
-        db.session.commit()
-
-        winner = db.session.get(Competitor, match.winner_id)
-
+        # Read everything the response needs before commit expires the loaded objects
+        if match.winner_id == match.competitor1_id:
+            winner = match.competitor1
+        elif match.winner_id == match.competitor2_id:
+            winner = match.competitor2
+        else:
+            winner = db.session.get(Competitor, match.winner_id)
         winner_name = winner.name
         match_number = match.match_number
+        round_name = match.round_name
+        ring_id = match.ring_id
+        is_poomsae = match.division.event_type == "poomsae"
+
+        db.session.commit()
 
-        if match.round_name == "Final":
+        if round_name == "Final":
             result_message = "wins gold!"
         else:
             result_message = "advances to the next round!"
@@ -1367,11 +1376,11 @@ def ui_record_result(match_id):
         # kyorugi and poomsae).
         return render_template(
             "_scorekeeper_result_oob.html",
-            match=match,
+            ring_id=ring_id,
             match_number=match_number,
             winner_name=winner_name,
             result_message=result_message,
-            is_poomsae=(match.division.event_type == "poomsae"),
+            is_poomsae=is_poomsae,
         )
 
 
@@ -1397,7 +1406,7 @@ def _build_poomsae_ranked(div_id):
 
 def _group_results_fragment_html(div_id, scorekeeper_mode=False):
     """Return the ranked scores table with score-entry forms for a poomsae/breaking division."""
-    division = Division.query.get_or_404(div_id)
+    division = db.get_or_404(Division, div_id)
     ranked = _build_poomsae_ranked(div_id)
     return render_template(
         "group_results_fragment.html",
@@ -1411,7 +1420,7 @@ def _group_results_fragment_html(div_id, scorekeeper_mode=False):
 @login_required
 def ui_set_poomsae_style(div_id):
     """Set the poomsae division style ('bracket' or 'group'). Locked once set."""
-    division = Division.query.get_or_404(div_id)
+    division = db.get_or_404(Division, div_id)
     if division.event_type != "poomsae":
         return "Not a poomsae division.", 400
     if division.poomsae_style is not None:
@@ -1421,7 +1430,7 @@ def ui_set_poomsae_style(div_id):
         return "Invalid style.", 400
     division.poomsae_style = style
     db.session.commit()
-    rings = Ring.query.all()
+    rings = _ring_choices()
     return render_template("_bracket_controls.html", division=division, rings=rings)
 
 
@@ -1429,7 +1438,7 @@ def ui_set_poomsae_style(div_id):
 @login_required
 def ui_poomsae_ring_assignment(div_id):
     """Assign a poomsae division to a ring and update its event status and ring sequence."""
-    division = Division.query.get_or_404(div_id)
+    division = db.get_or_404(Division, div_id)
     if division.event_type != "poomsae":
         return "Not a poomsae division.", 400
 
@@ -1438,7 +1447,7 @@ def ui_poomsae_ring_assignment(div_id):
     ring_sequence_raw = request.form.get("ring_sequence", "")
 
     if ring_id:
-        ring = Ring.query.get_or_404(int(ring_id))
+        ring = db.get_or_404(Ring, int(ring_id))
         division.ring_id = ring.id
     else:
         division.ring_id = None
@@ -1481,7 +1490,7 @@ def ui_poomsae_ring_assignment(div_id):
         division.ring_sequence = None
     db.session.commit()
 
-    rings = Ring.query.all()
+    rings = _ring_choices()
     return render_template("_bracket_controls.html", division=division, rings=rings)
 
 
@@ -1489,7 +1498,7 @@ def ui_poomsae_ring_assignment(div_id):
 @login_required
 def ui_update_event_status(div_id):
     """Update the event status of a poomsae division (used from the Scorekeeper page)."""
-    division = Division.query.get_or_404(div_id)
+    division = db.get_or_404(Division, div_id)
     event_status = request.form.get("event_status", "Pending")
     if event_status not in ("Pending", "In Progress", "Completed"):
         return "Invalid status.", 400
@@ -1517,12 +1526,12 @@ def ui_update_event_status(div_id):
 @login_required
 def ui_record_poomsae_score(div_id, comp_id):
     """Record or update a poomsae score for a single competitor."""
-    division = Division.query.get_or_404(div_id)
+    division = db.get_or_404(Division, div_id)
     # Ensure this route is only used for poomsae divisions.
     if division.event_type != "poomsae":
         return "Division is not a poomsae division.", 400
 
-    competitor = Competitor.query.get_or_404(comp_id)
+    competitor = db.get_or_404(Competitor, comp_id)
     if competitor.division_id != div_id:
         return "Not found", 404
 
@@ -1558,7 +1567,7 @@ def ui_group_results_fragment(div_id):
 @app.route("/ui/divisions/<int:div_id>/poomsae_placements_fragment")
 def ui_poomsae_placements_fragment(div_id):
     """HTMX fragment: read-only poomsae placements with medal rankings (1 gold, 1 silver, 2 bronze)."""
-    division = Division.query.get_or_404(div_id)
+    division = db.get_or_404(Division, div_id)
     ranked = _build_poomsae_ranked(div_id)
     return render_template("poomsae_placements_fragment.html", division=division, ranked=ranked)
 
@@ -1566,7 +1575,7 @@ def ui_poomsae_placements_fragment(div_id):
 @app.route("/admin/divisions/<int:div_id>/group_results")
 def group_results_page(div_id):
     """Read-only group results page showing medal placements (public/display view)."""
-    division = Division.query.get_or_404(div_id)
+    division = db.get_or_404(Division, div_id)
     return render_template("group_results.html", division=division)
 
 
@@ -1574,7 +1583,7 @@ def group_results_page(div_id):
 @login_required
 def poomsae_score_manage_page(div_id):
     """Admin poomsae score management page for entering and updating competitor scores."""
-    division = Division.query.get_or_404(div_id)
+    division = db.get_or_404(Division, div_id)
     return render_template("score_manage.html", division=division)
 
 
@@ -1583,14 +1592,14 @@ def poomsae_score_manage_page(div_id):
 def ui_ring_poomsae_divisions(ring_id):
     """HTMX fragment: all poomsae items for a ring (bracket matches + group divisions), sorted
     by their common ring sequence number so both types appear in the correct order together."""
-    Ring.query.get_or_404(ring_id)
+    db.get_or_404(Ring, ring_id)
 
     # --- Bracket poomsae matches assigned to this ring (Pending or In Progress) ---
     bracket_matches = (
         Match.query.filter(
             Match.ring_id == ring_id,
             Match.division.has(event_type="poomsae"),
-            Match.status.in_(["Pending", "In Progress"]),
+            Match.is_active(),
         )
         .order_by(Match.match_number)
         .all()
@@ -1631,7 +1640,7 @@ def ui_ring_poomsae_divisions(ring_id):
     # Sort: sequenced items first (ascending), unsequenced last
     items.sort(key=lambda item: (item[0] is None, item[0] or 0))
 
-    return "\n".join(html for _, html in items)
+    return "\n".join([html for _, html in items])
 
 
 # ---------------------------------------------------------------------------
@@ -6,6 +6,8 @@ db = SQLAlchemy()
 
 VALID_EVENT_TYPES = {"poomsae", "kyorugi"}
 COMPLETED_MATCH_STATUSES = {"Completed", "Completed (Bye)", "Disqualification"}
+ACTIVE_MATCH_STATUSES = ("Pending", "In Progress")
+_ACTIVE_MATCH_WHERE = "status IN ('Pending', 'In Progress')"
 
 
 class Ring(db.Model):
@@ -68,11 +70,36 @@ class Match(db.Model):
     competitor1 = db.relationship("Competitor", foreign_keys=[competitor1_id])
     competitor2 = db.relationship("Competitor", foreign_keys=[competitor2_id])
     winner = db.relationship("Competitor", foreign_keys=[winner_id])
+    next_match = db.relationship("Match", remote_side=[id], foreign_keys=[next_match_id])
+
+    @classmethod
+    def is_active(cls):
+        """Return a ``status IN ('Pending', 'In Progress')`` criterion.
+
+        The statuses are rendered as literals rather than bound parameters so that
+        SQLite can match the criterion against the ``ix_match_active_ring`` partial index.
+        """
+        statuses = db.bindparam(
+            "active_statuses", list(ACTIVE_MATCH_STATUSES), expanding=True, literal_execute=True, unique=True
+        )
+        return cls.status.in_(statuses)
 
     __table_args__ = (
         db.Index("ix_match_division_id", "division_id"),
         db.Index("ix_match_status", "status"),
         db.Index("ix_match_division_status", "division_id", "status"),
+        # Scorekeeper / live view: filter by ring + status, then walk in match_number order
+        db.Index("ix_match_ring_status_num", "ring_id", "status", "match_number"),
+        # Bracket pages: a division's matches grouped by round
+        db.Index("ix_match_division_round", "division_id", "round_name"),
+        # Active matches per ring in match_number order; partial, so completed rows are never visited
+        db.Index(
+            "ix_match_active_ring",
+            "ring_id",
+            "match_number",
+            sqlite_where=db.text(_ACTIVE_MATCH_WHERE),
+            postgresql_where=db.text(_ACTIVE_MATCH_WHERE),
+        ),
     )
 
 
@@ -18,10 +18,10 @@ except ModuleNotFoundError:  # Allows `python scripts/seed_dev_db.py`
 
 add_repo_root_to_path()
 
-import math
 import os
 import sys
 
+from api import _get_round_name
 from app import app
 from models import Competitor, Division, Match, Ring, db
 
@@ -71,16 +71,6 @@ COMPETITOR_SUFFIXES = ["Athlete A", "Athlete B", "Athlete C", "Athlete D"]
 # ---------------------------------------------------------------------------
 
 
-def _get_round_name(num_matches: int) -> str:
-    if num_matches == 1:
-        return "Final"
-    elif num_matches == 2:
-        return "Semi-Final"
-    elif num_matches == 4:
-        return "Quarter-Final"
-    return f"Round of {num_matches * 2}"
-
-
 def _add_competitors(division: Division, gender_prefix: str) -> list[Competitor]:
     competitors = []
     for pos, suffix in enumerate(COMPETITOR_SUFFIXES, start=1):
@@ -99,7 +89,7 @@ def _generate_bracket(division: Division, competitors: list[Competitor], ring: R
     Returns the next available sequence number within the ring.
     """
     num_comp = len(competitors)
-    next_power = 2 ** math.ceil(math.log2(num_comp))
+    next_power = 1 << (num_comp - 1).bit_length()
     num_first_round = next_power // 2
 
     # Distribute competitors into pairings (deal like a deck of cards)
@@ -134,33 +124,30 @@ def _generate_bracket(division: Division, competitors: list[Competitor], ring: R
 
     db.session.flush()
 
-    # Build subsequent rounds (bottom-up to the Final)
+    # Build subsequent rounds (bottom-up to the Final), flushing once per round
     while len(current_round) > 1:
+        r_name = _get_round_name(len(current_round) // 2)
+        pairs = list(zip(current_round[0::2], current_round[1::2]))
         next_round: list[Match] = []
-        for i in range(0, len(current_round), 2):
-            prev1 = current_round[i]
-            prev2 = current_round[i + 1]
-            r_name = _get_round_name(len(current_round) // 2)
-
+        for prev1, prev2 in pairs:
+            # Push bye winners forward immediately
             new_match = Match(
                 division_id=division.id,
                 ring_id=ring.id,
                 match_number=ring.id * 100 + seq,
+                competitor1_id=prev1.winner_id,
+                competitor2_id=prev2.winner_id,
                 round_name=r_name,
             )
-            # Push bye winners forward immediately
-            if prev1.winner_id:
-                new_match.competitor1_id = prev1.winner_id
-            if prev2.winner_id:
-                new_match.competitor2_id = prev2.winner_id
-
             db.session.add(new_match)
-            db.session.flush()
+            next_round.append(new_match)
+            seq += 1
 
+        # One flush assigns IDs to the whole round, then link the previous round to it
+        db.session.flush()
+        for (prev1, prev2), new_match in zip(pairs, next_round):
             prev1.next_match_id = new_match.id
             prev2.next_match_id = new_match.id
-            next_round.append(new_match)
-            seq += 1
 
         current_round = next_round
 
@@ -1,12 +1,13 @@
 import argparse
+import hashlib
 import json
 import os
 
-import boto3
-from dotenv import load_dotenv
 
+def main(env: str, debug: bool = False, s3_client=None):
+    # Imported here so `--help` and modules importing main() don't pay for it
+    from dotenv import load_dotenv
 
-def main(env: str, debug: bool = False):
     # Fetch variables
     load_dotenv(f"{env}.env")
     USER = os.getenv("user")
@@ -30,23 +31,37 @@ def main(env: str, debug: bool = False):
         "SECRET_KEY": SECRET_KEY,
     }
 
-    # Convert the Python object to a JSON formatted string
-    json_string = json.dumps(data)
+    # Serialise to the bytes S3 stores; compact separators keep the output (and its MD5) stable
+    body = json.dumps(data, separators=(",", ":")).encode()
 
     # S3 bucket and object details
     bucket_name = f"zappa-tkd-competition-manager-{env}"
     object_key = "secrets.json"
 
-    # Create an S3 client
+    # Create an S3 client unless one was supplied (e.g. a mock in tests)
     # Boto3 will automatically use credentials configured in your environment
-    s3_client = boto3.client("s3")
+    if s3_client is None:
+        import boto3
+
+        s3_client = boto3.client("s3")
 
     try:
+        # Skip the upload when S3 already holds identical content.  For a single-part
+        # upload without KMS encryption the ETag is the MD5 of the object body.
+        digest = hashlib.md5(body, usedforsecurity=False).hexdigest()
+        try:
+            head = s3_client.head_object(Bucket=bucket_name, Key=object_key)
+        except s3_client.exceptions.ClientError:
+            head = None  # No existing object (or it cannot be read); upload as usual
+        if head and head["ETag"].strip('"') == digest:
+            print(f"s3://{bucket_name}/{object_key} is unchanged; skipping upload")
+            return
+
         # Upload the JSON string directly to S3
         response = s3_client.put_object(
             Bucket=bucket_name,
             Key=object_key,
-            Body=json_string,
+            Body=body,
             ContentType="application/json",  # Set the content type
         )
         print(f"Successfully uploaded JSON object to s3://{bucket_name}/{object_key}")
@@ -3,11 +3,20 @@ import os
 # Must be set before app.py is imported so the SQLite URI is used instead of PostgreSQL
 os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
 
+# Under pytest-xdist every worker is a separate process, so an in-memory database is
+# already private to it.  A file-backed SQLite database gets one file per worker.
+_xdist_worker = os.environ.get("PYTEST_XDIST_WORKER")
+_database_url = os.environ["DATABASE_URL"]
+if _xdist_worker and _database_url.startswith("sqlite:///") and ":memory:" not in _database_url:
+    os.environ["DATABASE_URL"] = f"{_database_url}-{_xdist_worker}"
+
 import pytest
+from jinja2 import TemplateSyntaxError
+from sqlalchemy import event
 
-from api import _generate_raw_token, _hash_token
+from api import _build_bracket, _cached_rings, _generate_raw_token, _hash_token
 from app import app as flask_app
-from models import ApiToken
+from models import ApiToken, Competitor, Division, Ring
 from models import db as _db
 
 # Test user shared by both the session-based and Bearer-token test clients.
@@ -15,25 +24,62 @@ _TEST_USER_EMAIL = "test@example.com"
 _TEST_USER_ID = "test-user-id"
 
 
+def _enable_sqlite_savepoints(engine):
+    """Let pysqlite honour SAVEPOINTs by handing transaction control to SQLAlchemy.
+
+    pysqlite emits its own ``BEGIN``/``COMMIT`` around DML, which silently discards
+    SAVEPOINTs.  Switching the driver to autocommit and emitting ``BEGIN`` from the
+    ``begin`` event is the documented SQLAlchemy workaround.
+    """
+
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+
 @pytest.fixture(scope="session")
 def app():
+    # The engine is built by db.init_app() when app.py is imported, from DATABASE_URL above;
+    # setting SQLALCHEMY_DATABASE_URI / SQLALCHEMY_ENGINE_OPTIONS here would have no effect.
+    # For the default in-memory SQLite URL, Flask-SQLAlchemy already uses a StaticPool with
+    # check_same_thread=False, so every request shares the one in-memory connection.
+    # SQLALCHEMY_TRACK_MODIFICATIONS is already False in app.py, where it has to be set before
+    # db.init_app() to take effect.  PROPAGATE_EXCEPTIONS makes a failing view raise in the test
+    # instead of rendering a 500 page.
     flask_app.config.update(
         {
             "TESTING": True,
-            "SQLALCHEMY_DATABASE_URI": os.environ.get("DATABASE_URL", "sqlite:///:memory:"),
+            "DEBUG": False,
+            "PROPAGATE_EXCEPTIONS": True,
             "WTF_CSRF_ENABLED": False,
         }
     )
     ctx = flask_app.app_context()
     ctx.push()
+    if _db.engine.dialect.name == "sqlite":
+        _enable_sqlite_savepoints(_db.engine)
     _db.create_all()
     yield flask_app
     _db.drop_all()
     ctx.pop()
 
 
+@pytest.fixture(scope="session", autouse=True)
+def _warm_jinja(app):
+    """Compile every template once up front so no single test pays the first-render cost."""
+    for name in app.jinja_env.list_templates():
+        try:
+            app.jinja_env.get_template(name)
+        except TemplateSyntaxError:
+            pass  # Reported by whichever test renders the template
+
+
 @pytest.fixture
-def client(app):
+def client(app, db_session):
     c = app.test_client()
     with c.session_transaction() as sess:
         sess["user"] = {"email": _TEST_USER_EMAIL, "id": _TEST_USER_ID}
@@ -41,7 +87,7 @@ def client(app):
 
 
 @pytest.fixture
-def api_client(app):
+def api_client(app, db_session):
     """Test client for /api/v1 endpoints.
 
     Creates a real ``ApiToken`` row in the database and pre-configures
@@ -49,14 +95,14 @@ def api_client(app):
     Flask session so that legacy helper routes (competitor/bracket setup) still
     pass ``login_required``.
 
-    The token row is cleaned up by the ``clean_db`` autouse fixture that runs
-    after each test.
+    The token row is rolled back with the rest of the test's writes by
+    ``db_session``.
     """
     raw_token = _generate_raw_token()
     token_hash = _hash_token(raw_token)
     token = ApiToken(name="test-token", token_hash=token_hash, user_id=_TEST_USER_ID)
-    _db.session.add(token)
-    _db.session.commit()
+    db_session.add(token)
+    db_session.commit()
 
     c = app.test_client()
     c.environ_base["HTTP_AUTHORIZATION"] = f"Bearer {raw_token}"
@@ -65,12 +111,108 @@ def api_client(app):
     return c
 
 
+@pytest.fixture(scope="session")
+def db_connection(app):
+    """Hold one connection with an outer transaction open for the whole test run.
+
+    Flask-SQLAlchemy resolves session binds through ``db.engines`` (it ignores
+    ``Session.bind``), so the default bind is pointed at this connection.  With
+    ``join_transaction_mode="create_savepoint"`` every ``commit()`` issued by the
+    app then releases a SAVEPOINT instead of committing.
+    """
+    engine = _db.engine
+    connection = engine.connect()
+    transaction = connection.begin()
+    _db.session.remove()
+    _db.engines[None] = connection
+    _db.session.configure(join_transaction_mode="create_savepoint")
+    yield connection
+    _db.session.remove()
+    _db.session.configure(join_transaction_mode="conservative_savepoint")
+    _db.engines[None] = engine
+    transaction.rollback()
+    connection.close()
+
+
 @pytest.fixture(autouse=True)
-def clean_db(app):
-    """Truncate all tables between tests to ensure isolation."""
-    yield
-    _db.session.rollback()
-    for table in reversed(_db.metadata.sorted_tables):
-        _db.session.execute(table.delete())
-    _db.session.commit()
+def db_session(db_connection):
+    """Yield the app's scoped session inside a per-test SAVEPOINT that is rolled back afterwards.
+
+    The schema is created once per run by ``app``; teardown is a single
+    ``ROLLBACK TO SAVEPOINT`` regardless of how many rows the test wrote.  Because
+    the session joins the outer connection with ``create_savepoint``, each
+    ``commit()`` in the app starts a fresh SAVEPOINT on its own, so no
+    ``after_transaction_end`` restart hook is needed.  Autouse keeps tests that
+    touch ``db.session`` without a client isolated too.  The ring list cache is
+    cleared as well, since the rollback bypasses the routes that invalidate it.
+    """
+    nested = db_connection.begin_nested()
+    _cached_rings.cache_clear()
+    yield _db.session
     _db.session.remove()
+    nested.rollback()
+    _cached_rings.cache_clear()
+
+
+@pytest.fixture
+def division_id(db_session):
+    """ID of an empty kyorugi division, inserted directly rather than through ``POST /divisions``.
+
+    Uses the same name and event type as the tests' ``_create_division`` helper defaults.
+    """
+    division = Division(name="Male - Black Belt - Under 70kg", event_type="kyorugi")
+    db_session.add(division)
+    db_session.commit()
+    return division.id
+
+
+@pytest.fixture
+def ring_id(db_session):
+    """ID of a ring named "Ring 1", inserted directly rather than through ``POST /rings``."""
+    ring = Ring(name="Ring 1")
+    db_session.add(ring)
+    db_session.commit()
+    return ring.id
+
+
+def _bracket_division(session, division_id, names):
+    """Add *names* to the division in roster order, generate its bracket and return the division id.
+
+    Goes straight through the ORM and the shared bracket builder rather than the
+    competitor and bracket-generation routes.
+    """
+    competitors = [Competitor(name=name, division_id=division_id, position=i) for i, name in enumerate(names, start=1)]
+    session.add_all(competitors)
+    session.flush()
+    _build_bracket(division_id, [competitor.id for competitor in competitors])
+    session.commit()
+    return division_id
+
+
+@pytest.fixture
+def bracket_div_2c(db_session, division_id):
+    """ID of a division with a generated Alice vs Bob bracket (a single Final)."""
+    return _bracket_division(db_session, division_id, ["Alice", "Bob"])
+
+
+@pytest.fixture
+def bracket_div_4c(db_session, division_id):
+    """ID of a division with a generated Alice/Bob/Carol/Dave bracket (two Semi-Finals and a Final)."""
+    return _bracket_division(db_session, division_id, ["Alice", "Bob", "Carol", "Dave"])
+
+
+@pytest.fixture
+def make_bracket_division(db_session):
+    """Factory fixture: ``make_bracket_division(names, name=..., event_type=...)`` returns a division id.
+
+    Creates the division and its competitors and generates the bracket in-process,
+    replacing the create-division / add-competitors / generate-bracket request trio.
+    """
+
+    def _make(names, name="Male - Black Belt - Under 70kg", event_type="kyorugi"):
+        division = Division(name=name, event_type=event_type)
+        db_session.add(division)
+        db_session.flush()
+        return _bracket_division(db_session, division.id, names)
+
+    return _make
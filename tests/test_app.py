@@ -4,7 +4,7 @@ import re
 
 import pytest
 
-from app import _abbrev_round
+from app import _abbrev_round, _public_match_view, _short_name
 from models import Competitor, Division, Match, Ring, db
 
 # ---------------------------------------------------------------------------
@@ -32,6 +32,16 @@ def _generate_bracket(client, div_id):
     return client.post(f"/divisions/{div_id}/generate_bracket")
 
 
+def _round_match_ids(div_id, round_name):
+    """Return ``(id, competitor1_id, competitor2_id)`` of the first match in a round, without loading a Match."""
+    return db.session.execute(
+        db.select(Match.id, Match.competitor1_id, Match.competitor2_id)
+        .filter_by(division_id=div_id, round_name=round_name)
+        .order_by(Match.id)
+        .limit(1)
+    ).first()
+
+
 def _set_poomsae_style(client, div_id, style):
     """Set the poomsae_style for a division ('bracket' or 'group')."""
     return client.post(
@@ -68,6 +78,60 @@ class TestAbbrevRound:
         assert _abbrev_round(None) is None
 
 
+# ---------------------------------------------------------------------------
+# _short_name unit tests
+# ---------------------------------------------------------------------------
+
+
+class TestShortName:
+    def test_first_initial_and_last_name(self):
+        assert _short_name(Competitor(name="Alice Smith")) == "A. Smith"
+
+    def test_middle_names_skipped(self):
+        assert _short_name(Competitor(name="Mary Jane Watson")) == "M. Watson"
+
+    def test_single_name(self):
+        assert _short_name(Competitor(name="Cher")) == "C. Cher"
+
+    def test_empty_slot(self):
+        assert _short_name(None) == "TBD"
+
+
+class TestPublicMatchView:
+    def test_completed_match_view(self):
+        alice = Competitor(id=1, name="Alice Smith")
+        match = Match(
+            match_number=101,
+            division=Division(id=7, name="Black Belt"),
+            division_id=7,
+            round_name="Semi-Final",
+            competitor1=alice,
+            competitor1_id=1,
+            competitor2=None,
+            competitor2_id=None,
+            winner_id=1,
+            status="Completed",
+        )
+        view = _public_match_view(match)
+        assert view == {
+            "match_number": 101,
+            "division_id": 7,
+            "division_name": "Black Belt",
+            "round_short": "SF",
+            "comp_1": "A. Smith",
+            "comp_2": "TBD",
+            "comp_1_result": "W",
+            "comp_2_result": "L",
+            "status": "Completed",
+        }
+        assert not hasattr(match, "comp_1")
+
+    def test_undecided_match_has_neutral_results(self):
+        match = Match(division=Division(name="Div"), round_name="Final", status="Pending")
+        view = _public_match_view(match)
+        assert view["comp_1_result"] == view["comp_2_result"] == "-"
+
+
 # ---------------------------------------------------------------------------
 # Ring API endpoints
 # ---------------------------------------------------------------------------
@@ -165,14 +229,14 @@ class TestBracketAPI:
         resp = _generate_bracket(client, 9999)
         assert resp.status_code == 404
 
-    def test_generate_bracket_too_few_competitors(self, client):
-        div_id = _create_division(client).get_json()["id"]
+    def test_generate_bracket_too_few_competitors(self, client, division_id):
+        div_id = division_id
         _add_competitors(client, div_id, ["Alice"])
         resp = _generate_bracket(client, div_id)
         assert resp.status_code == 400
 
-    def test_generate_bracket_two_competitors(self, client):
-        div_id = _create_division(client).get_json()["id"]
+    def test_generate_bracket_two_competitors(self, client, division_id):
+        div_id = division_id
         _add_competitors(client, div_id, ["Alice", "Bob"])
         resp = _generate_bracket(client, div_id)
         assert resp.status_code == 200
@@ -180,8 +244,8 @@ class TestBracketAPI:
         # 2 competitors → 1 match → named "Final"
         assert Match.query.filter_by(division_id=div_id, round_name="Final").count() == 1
 
-    def test_generate_bracket_four_competitors(self, client):
-        div_id = _create_division(client).get_json()["id"]
+    def test_generate_bracket_four_competitors(self, client, division_id):
+        div_id = division_id
         _add_competitors(client, div_id, ["A", "B", "C", "D"])
         resp = _generate_bracket(client, div_id)
         assert resp.status_code == 200
@@ -189,8 +253,8 @@ class TestBracketAPI:
         assert Match.query.filter_by(division_id=div_id, round_name="Semi-Final").count() == 2
         assert Match.query.filter_by(division_id=div_id, round_name="Final").count() == 1
 
-    def test_generate_bracket_eight_competitors_round_names(self, client):
-        div_id = _create_division(client).get_json()["id"]
+    def test_generate_bracket_eight_competitors_round_names(self, client, division_id):
+        div_id = division_id
         _add_competitors(client, div_id, ["A", "B", "C", "D", "E", "F", "G", "H"])
         _generate_bracket(client, div_id)
         # 8 competitors → Quarter-Final (4), Semi-Final (2), Final (1)
@@ -198,8 +262,8 @@ class TestBracketAPI:
         assert Match.query.filter_by(division_id=div_id, round_name="Semi-Final").count() == 2
         assert Match.query.filter_by(division_id=div_id, round_name="Final").count() == 1
 
-    def test_generate_bracket_sixteen_competitors_round_names(self, client):
-        div_id = _create_division(client).get_json()["id"]
+    def test_generate_bracket_sixteen_competitors_round_names(self, client, division_id):
+        div_id = division_id
         _add_competitors(client, div_id, [str(i) for i in range(1, 17)])
         _generate_bracket(client, div_id)
         # 16 competitors → Round of 16 (8), Quarter-Final (4), Semi-Final (2), Final (1)
@@ -208,8 +272,8 @@ class TestBracketAPI:
         assert Match.query.filter_by(division_id=div_id, round_name="Semi-Final").count() == 2
         assert Match.query.filter_by(division_id=div_id, round_name="Final").count() == 1
 
-    def test_generate_bracket_three_competitors_creates_bye(self, client):
-        div_id = _create_division(client).get_json()["id"]
+    def test_generate_bracket_three_competitors_creates_bye(self, client, division_id):
+        div_id = division_id
         _add_competitors(client, div_id, ["A", "B", "C"])
         resp = _generate_bracket(client, div_id)
         assert resp.status_code == 200
@@ -217,15 +281,35 @@ class TestBracketAPI:
         bye_matches = Match.query.filter_by(division_id=div_id, status="Completed (Bye)").all()
         assert len(bye_matches) >= 1
 
-    def test_get_bracket_no_bracket(self, client):
-        div_id = _create_division(client).get_json()["id"]
+    def test_generate_bracket_links_rounds_and_advances_byes(self, client, division_id):
+        div_id = division_id
+        _add_competitors(client, div_id, ["A", "B", "C", "D", "E"])
+        _generate_bracket(client, div_id)
+
+        quarter_finals = Match.query.filter_by(division_id=div_id, round_name="Quarter-Final").order_by(Match.id).all()
+        semi_finals = Match.query.filter_by(division_id=div_id, round_name="Semi-Final").order_by(Match.id).all()
+        final = Match.query.filter_by(division_id=div_id, round_name="Final").one()
+
+        # Each pair of matches feeds the same match in the next round
+        assert [m.next_match_id for m in quarter_finals] == [semi_finals[0].id] * 2 + [semi_finals[1].id] * 2
+        assert [m.next_match_id for m in semi_finals] == [final.id, final.id]
+        assert final.next_match_id is None
+
+        # 5 competitors in 4 slots → 3 byes whose winners are already placed in the Semi-Finals
+        byes = [m for m in quarter_finals if m.status == "Completed (Bye)"]
+        assert len(byes) == 3
+        assert semi_finals[0].competitor1_id is None
+        assert semi_finals[0].competitor2_id == quarter_finals[1].winner_id
+        assert semi_finals[1].competitor1_id == quarter_finals[2].winner_id
+        assert semi_finals[1].competitor2_id == quarter_finals[3].winner_id
+
+    def test_get_bracket_no_bracket(self, client, division_id):
+        div_id = division_id
         resp = client.get(f"/divisions/{div_id}/bracket")
         assert resp.status_code == 404
 
-    def test_get_bracket_returns_matches(self, client):
-        div_id = _create_division(client).get_json()["id"]
-        _add_competitors(client, div_id, ["Alice", "Bob"])
-        _generate_bracket(client, div_id)
+    def test_get_bracket_returns_matches(self, client, bracket_div_2c):
+        div_id = bracket_div_2c
 
         resp = client.get(f"/divisions/{div_id}/bracket")
         assert resp.status_code == 200
@@ -237,6 +321,18 @@ class TestBracketAPI:
         assert "round_name" in match
         assert "status" in match
 
+    def test_get_bracket_includes_competitor_names(self, client, division_id):
+        div_id = division_id
+        _add_competitors(client, div_id, ["Alice", "Bob", "Carol"])
+        _generate_bracket(client, div_id)
+
+        data = client.get(f"/divisions/{div_id}/bracket").get_json()
+        names = {c["name"] for m in data for c in (m["competitor1"], m["competitor2"]) if c}
+        assert names == {"Alice", "Bob", "Carol"}
+        # Only the bye winner has reached the Final so far; the other slot is still TBD
+        final = next(m for m in data if m["round_name"] == "Final")
+        assert [c["name"] for c in (final["competitor1"], final["competitor2"]) if c] == ["Bob"]
+
 
 # ---------------------------------------------------------------------------
 # Match result recording
@@ -244,12 +340,10 @@ class TestBracketAPI:
 
 
 class TestMatchResultAPI:
-    def test_record_result_completed(self, client):
-        div_id = _create_division(client).get_json()["id"]
-        _add_competitors(client, div_id, ["Alice", "Bob"])
-        _generate_bracket(client, div_id)
+    def test_record_result_completed(self, client, bracket_div_2c):
+        div_id = bracket_div_2c
 
-        match = Match.query.filter_by(division_id=div_id, round_name="Final").first()
+        match = _round_match_ids(div_id, "Final")
         winner_id = match.competitor1_id
 
         resp = client.post(
@@ -259,21 +353,17 @@ class TestMatchResultAPI:
         assert resp.status_code == 200
         assert "Result recorded" in resp.get_json()["message"]
 
-    def test_record_result_missing_winner(self, client):
-        div_id = _create_division(client).get_json()["id"]
-        _add_competitors(client, div_id, ["Alice", "Bob"])
-        _generate_bracket(client, div_id)
+    def test_record_result_missing_winner(self, client, bracket_div_2c):
+        div_id = bracket_div_2c
 
-        match = Match.query.filter_by(division_id=div_id, round_name="Final").first()
+        match = _round_match_ids(div_id, "Final")
         resp = client.post(f"/matches/{match.id}/result", json={"status": "Completed"})
         assert resp.status_code == 400
 
-    def test_record_result_disqualification(self, client):
-        div_id = _create_division(client).get_json()["id"]
-        _add_competitors(client, div_id, ["Alice", "Bob"])
-        _generate_bracket(client, div_id)
+    def test_record_result_disqualification(self, client, bracket_div_2c):
+        div_id = bracket_div_2c
 
-        match = Match.query.filter_by(division_id=div_id, round_name="Final").first()
+        match = _round_match_ids(div_id, "Final")
         winner_id = match.competitor2_id
 
         resp = client.post(
@@ -286,14 +376,14 @@ class TestMatchResultAPI:
         resp = client.post(f"/matches/9999/result", json={"status": "Completed", "winner_id": 1})
         assert resp.status_code == 404
 
-    def test_bracket_advancement_after_result(self, client):
+    def test_bracket_advancement_after_result(self, client, division_id):
         """Winner should be placed into the next match after recording result.
 
         Uses 4 competitors so the Semi-Final produces two matches each with a next_match_id
         pointing to the Final match. Verifies that the winning competitor
         appears as competitor1 or competitor2 of that next match.
         """
-        div_id = _create_division(client).get_json()["id"]
+        div_id = division_id
         _add_competitors(client, div_id, ["A", "B", "C", "D"])
         _generate_bracket(client, div_id)
 
@@ -306,11 +396,20 @@ class TestMatchResultAPI:
             json={"status": "Completed", "winner_id": winner_id},
         )
 
-        # The winner should appear in the next match
-        db.session.expire_all()
-        next_match = db.session.get(Match, match.next_match_id)
+        # The winner should appear in the next match; reload just that row rather than expiring the session
+        next_match = db.session.get(Match, match.next_match_id, populate_existing=True)
         assert next_match.competitor1_id == winner_id or next_match.competitor2_id == winner_id
 
+    def test_next_match_relationship(self, client, division_id):
+        div_id = division_id
+        _add_competitors(client, div_id, ["A", "B", "C", "D"])
+        _generate_bracket(client, div_id)
+
+        final = Match.query.filter_by(division_id=div_id, round_name="Final").one()
+        for semi in Match.query.filter_by(division_id=div_id, round_name="Semi-Final").all():
+            assert semi.next_match is final
+        assert final.next_match is None
+
 
 # ---------------------------------------------------------------------------
 # HTMX UI – Ring routes
@@ -347,6 +446,15 @@ class TestUIRings:
         resp = client.delete("/ui/rings/9999")
         assert resp.status_code == 404
 
+    def test_ui_public_rings_reflects_ring_add_and_delete(self, client):
+        """The cached ring list is invalidated by the ring management routes."""
+        client.post("/ui/rings", data={"name": "Cached Ring"})
+        assert b"Cached Ring" in client.get("/ui/public_rings").data
+
+        ring = Ring.query.filter_by(name="Cached Ring").one()
+        client.delete(f"/ui/rings/{ring.id}")
+        assert b"Cached Ring" not in client.get("/ui/public_rings").data
+
     def test_ui_public_rings_empty(self, client):
         resp = client.get("/ui/public_rings")
         assert resp.status_code == 200
@@ -607,6 +715,82 @@ class TestUIRings:
         assert "Semi-Final" not in body
         assert "Final" not in body
 
+    def test_ui_public_rings_groups_matches_per_ring(self, client):
+        """Each ring shows only its own matches, its own last completed match and its own 4-match cap."""
+        ring1 = Ring(name="Ring 1")
+        ring2 = Ring(name="Ring 2")
+        division = Division(name="Test Division", event_type="kyorugi")
+        db.session.add_all([ring1, ring2, division])
+        db.session.flush()
+
+        comps = [Competitor(name=f"Fighter {i}", division_id=division.id) for i in range(1, 15)]
+        db.session.add_all(comps)
+        db.session.flush()
+
+        # Ring 1: one completed match and five pending matches
+        db.session.add(Match(
+            ring_id=ring1.id, division_id=division.id,
+            competitor1_id=comps[0].id, competitor2_id=comps[1].id,
+            status="Completed", winner_id=comps[0].id, match_number=110, round_name="Round of 16",
+        ))
+        for i in range(5):
+            db.session.add(Match(
+                ring_id=ring1.id, division_id=division.id,
+                competitor1_id=comps[2].id, competitor2_id=comps[3].id,
+                status="Pending", match_number=111 + i, round_name="Round of 16",
+            ))
+        # Ring 2: a newer completed match and one pending match
+        db.session.add(Match(
+            ring_id=ring2.id, division_id=division.id,
+            competitor1_id=comps[10].id, competitor2_id=comps[11].id,
+            status="Completed", winner_id=comps[11].id, match_number=250, round_name="Round of 16",
+        ))
+        db.session.add(Match(
+            ring_id=ring2.id, division_id=division.id,
+            competitor1_id=comps[12].id, competitor2_id=comps[13].id,
+            status="Pending", match_number=251, round_name="Round of 16",
+        ))
+        db.session.commit()
+
+        resp = client.get("/ui/public_rings")
+        assert resp.status_code == 200
+        body = resp.data.decode()
+
+        ring1_html, ring2_html = body.split("<h2>Ring 2</h2>")
+        assert [int(n) for n in re.findall(r"<strong>(\d+)</strong>", ring1_html)] == [110, 111, 112, 113, 114]
+        assert [int(n) for n in re.findall(r"<strong>(\d+)</strong>", ring2_html)] == [250, 251]
+
+    def test_ui_public_rings_last_completed_not_confused_across_rings(self, client):
+        """A ring's latest match_number that also exists in another ring must not replace that ring's latest match."""
+        ring1 = Ring(name="Ring 1")
+        ring2 = Ring(name="Ring 2")
+        division = Division(name="Test Division", event_type="kyorugi")
+        db.session.add_all([ring1, ring2, division])
+        db.session.flush()
+
+        comps = [Competitor(name=f"Fighter {i}", division_id=division.id) for i in range(1, 7)]
+        db.session.add_all(comps)
+        db.session.flush()
+
+        # match_number is freely settable through the API, so the same number can appear in two rings
+        for ring, c1, c2, number in [
+            (ring1, comps[0], comps[1], 150),
+            (ring1, comps[2], comps[3], 120),
+            (ring2, comps[4], comps[5], 120),
+        ]:
+            db.session.add(Match(
+                ring_id=ring.id, division_id=division.id,
+                competitor1_id=c1.id, competitor2_id=c2.id,
+                status="Completed", winner_id=c1.id, match_number=number, round_name="Final",
+            ))
+        db.session.commit()
+
+        resp = client.get("/ui/public_rings")
+        assert resp.status_code == 200
+        ring1_html, ring2_html = resp.data.decode().split("<h2>Ring 2</h2>")
+        assert re.findall(r"<strong>(\d+)</strong>", ring1_html) == ["150"]
+        assert re.findall(r"<strong>(\d+)</strong>", ring2_html) == ["120"]
+
 
 # ---------------------------------------------------------------------------
 # HTMX UI – Division routes
@@ -643,16 +827,14 @@ class TestUIDivisions:
         resp = client.delete("/ui/divisions/9999")
         assert resp.status_code == 404
 
-    def test_ui_delete_division_cascades(self, client):
+    def test_ui_delete_division_cascades(self, client, make_bracket_division):
         """Deleting a division should also remove its competitors and matches.
 
         The cascade is implemented explicitly in the ui_delete_division route via
         Match.query.filter_by().delete() and Competitor.query.filter_by().delete()
         before deleting the division record itself.
         """
-        div_id = _create_division(client, "Cascade Div").get_json()["id"]
-        _add_competitors(client, div_id, ["A", "B"])
-        _generate_bracket(client, div_id)
+        div_id = make_bracket_division(["A", "B"], "Cascade Div")
 
         client.delete(f"/ui/divisions/{div_id}")
 
@@ -666,34 +848,34 @@ class TestUIDivisions:
 
 
 class TestUICompetitors:
-    def test_ui_add_competitors(self, client):
-        div_id = _create_division(client).get_json()["id"]
+    def test_ui_add_competitors(self, client, division_id):
+        div_id = division_id
         resp = _add_competitors(client, div_id, ["Alice", "Bob"])
         assert resp.status_code == 200
         assert b"Alice" in resp.data
         assert b"Bob" in resp.data
 
-    def test_ui_add_competitors_empty_input(self, client):
-        div_id = _create_division(client).get_json()["id"]
+    def test_ui_add_competitors_empty_input(self, client, division_id):
+        div_id = division_id
         resp = client.post(f"/ui/divisions/{div_id}/competitors", data={"names": ""})
         assert resp.status_code == 200
 
-    def test_ui_competitors_list_empty(self, client):
-        div_id = _create_division(client).get_json()["id"]
+    def test_ui_competitors_list_empty(self, client, division_id):
+        div_id = division_id
         resp = client.get(f"/ui/divisions/{div_id}/competitors_list")
         assert resp.status_code == 200
         assert b"No competitors" in resp.data
 
-    def test_ui_competitors_list_with_competitors(self, client):
-        div_id = _create_division(client).get_json()["id"]
+    def test_ui_competitors_list_with_competitors(self, client, division_id):
+        div_id = division_id
         _add_competitors(client, div_id, ["Charlie", "Dana"])
         resp = client.get(f"/ui/divisions/{div_id}/competitors_list")
         assert resp.status_code == 200
         assert b"Charlie" in resp.data
         assert b"Dana" in resp.data
 
-    def test_ui_delete_competitor(self, client):
-        div_id = _create_division(client).get_json()["id"]
+    def test_ui_delete_competitor(self, client, division_id):
+        div_id = division_id
         _add_competitors(client, div_id, ["Alice", "Bob"])
         comp = Competitor.query.filter_by(division_id=div_id, name="Alice").first()
 
@@ -703,9 +885,9 @@ class TestUICompetitors:
         assert b"Bob" in resp.data
         assert db.session.get(Competitor, comp.id) is None
 
-    def test_ui_delete_competitor_clears_bracket(self, client):
+    def test_ui_delete_competitor_clears_bracket(self, client, division_id):
         """Deleting a competitor must also clear all bracket matches for the division."""
-        div_id = _create_division(client).get_json()["id"]
+        div_id = division_id
         _add_competitors(client, div_id, ["Alice", "Bob", "Carol"])
         _generate_bracket(client, div_id)
         assert Match.query.filter_by(division_id=div_id).count() > 0
@@ -716,8 +898,8 @@ class TestUICompetitors:
         # All matches for this division must be gone; bracket must be regenerated
         assert Match.query.filter_by(division_id=div_id).count() == 0
 
-    def test_ui_delete_competitor_not_found(self, client):
-        div_id = _create_division(client).get_json()["id"]
+    def test_ui_delete_competitor_not_found(self, client, division_id):
+        div_id = division_id
         resp = client.delete(f"/ui/divisions/{div_id}/competitors/9999")
         assert resp.status_code == 404
 
@@ -730,8 +912,8 @@ class TestUICompetitors:
         resp = client.delete(f"/ui/divisions/{div2_id}/competitors/{comp.id}")
         assert resp.status_code == 404
 
-    def test_ui_move_competitor_down(self, client):
-        div_id = _create_division(client).get_json()["id"]
+    def test_ui_move_competitor_down(self, client, division_id):
+        div_id = division_id
         _add_competitors(client, div_id, ["First", "Second", "Third"])
         comp = Competitor.query.filter_by(division_id=div_id, name="First").first()
 
@@ -745,8 +927,8 @@ class TestUICompetitors:
         body = resp.data.decode()
         assert body.index("First") > body.index("Second")
 
-    def test_ui_move_competitor_up(self, client):
-        div_id = _create_division(client).get_json()["id"]
+    def test_ui_move_competitor_up(self, client, division_id):
+        div_id = division_id
         _add_competitors(client, div_id, ["First", "Second", "Third"])
         comp = Competitor.query.filter_by(division_id=div_id, name="Third").first()
 
@@ -760,8 +942,8 @@ class TestUICompetitors:
         body = resp.data.decode()
         assert body.index("Third") < body.index("Second")
 
-    def test_ui_move_competitor_at_top_noop(self, client):
-        div_id = _create_division(client).get_json()["id"]
+    def test_ui_move_competitor_at_top_noop(self, client, division_id):
+        div_id = division_id
         _add_competitors(client, div_id, ["First", "Second"])
         comp = Competitor.query.filter_by(division_id=div_id, name="First").first()
         original_position = comp.position
@@ -774,8 +956,8 @@ class TestUICompetitors:
         db.session.refresh(comp)
         assert comp.position == original_position
 
-    def test_ui_move_competitor_at_bottom_noop(self, client):
-        div_id = _create_division(client).get_json()["id"]
+    def test_ui_move_competitor_at_bottom_noop(self, client, division_id):
+        div_id = division_id
         _add_competitors(client, div_id, ["First", "Second"])
         comp = Competitor.query.filter_by(division_id=div_id, name="Second").first()
         original_position = comp.position
@@ -788,25 +970,25 @@ class TestUICompetitors:
         db.session.refresh(comp)
         assert comp.position == original_position
 
-    def test_ui_move_competitor_not_found(self, client):
-        div_id = _create_division(client).get_json()["id"]
+    def test_ui_move_competitor_not_found(self, client, division_id):
+        div_id = division_id
         resp = client.post(
             f"/ui/divisions/{div_id}/competitors/9999/move",
             data={"direction": "up"},
         )
         assert resp.status_code == 404
 
-    def test_ui_competitors_ordered_by_position(self, client):
-        div_id = _create_division(client).get_json()["id"]
+    def test_ui_competitors_ordered_by_position(self, client, division_id):
+        div_id = division_id
         _add_competitors(client, div_id, ["Alpha", "Beta", "Gamma"])
 
         resp = client.get(f"/ui/divisions/{div_id}/competitors_list")
         body = resp.data.decode()
         assert body.index("Alpha") < body.index("Beta") < body.index("Gamma")
 
-    def test_ui_add_competitors_appends_with_position(self, client):
+    def test_ui_add_competitors_appends_with_position(self, client, division_id):
         """Adding competitors in two batches keeps them in insertion order."""
-        div_id = _create_division(client).get_json()["id"]
+        div_id = division_id
         _add_competitors(client, div_id, ["Alice", "Bob"])
         _add_competitors(client, div_id, ["Carol"])
 
@@ -865,11 +1047,9 @@ class TestUIDivisionRename:
 
 
 class TestBracketRegeneration:
-    def test_regenerate_bracket_replaces_existing_matches(self, client):
+    def test_regenerate_bracket_replaces_existing_matches(self, client, bracket_div_2c):
         """Calling generate_bracket a second time deletes old matches and creates new ones."""
-        div_id = _create_division(client).get_json()["id"]
-        _add_competitors(client, div_id, ["Alice", "Bob"])
-        _generate_bracket(client, div_id)
+        div_id = bracket_div_2c
 
         # Add a third competitor so the bracket structure changes
         _add_competitors(client, div_id, ["Carol"])
@@ -883,11 +1063,9 @@ class TestBracketRegeneration:
         match_count_after = Match.query.filter_by(division_id=div_id).count()
         assert match_count_after != match_count_before
 
-    def test_regenerate_bracket_with_added_competitor(self, client):
+    def test_regenerate_bracket_with_added_competitor(self, client, bracket_div_2c):
         """After adding a competitor and regenerating, the new competitor appears in matches."""
-        div_id = _create_division(client).get_json()["id"]
-        _add_competitors(client, div_id, ["Alice", "Bob"])
-        _generate_bracket(client, div_id)
+        div_id = bracket_div_2c
 
         _add_competitors(client, div_id, ["Carol"])
         resp = _generate_bracket(client, div_id)
@@ -905,10 +1083,8 @@ class TestBracketRegeneration:
 
 
 class TestUIMatchResult:
-    def test_ui_record_result_in_progress(self, client):
-        div_id = _create_division(client).get_json()["id"]
-        _add_competitors(client, div_id, ["Alice", "Bob"])
-        _generate_bracket(client, div_id)
+    def test_ui_record_result_in_progress(self, client, bracket_div_2c):
+        div_id = bracket_div_2c
 
         match = Match.query.filter_by(division_id=div_id, round_name="Final").first()
         resp = client.post(
@@ -920,12 +1096,10 @@ class TestUIMatchResult:
         db.session.refresh(match)
         assert match.status == "In Progress"
 
-    def test_ui_record_result_completed(self, client):
-        div_id = _create_division(client).get_json()["id"]
-        _add_competitors(client, div_id, ["Alice", "Bob"])
-        _generate_bracket(client, div_id)
+    def test_ui_record_result_completed(self, client, bracket_div_2c):
+        div_id = bracket_div_2c
 
-        match = Match.query.filter_by(division_id=div_id, round_name="Final").first()
+        match = _round_match_ids(div_id, "Final")
         winner_id = match.competitor1_id
 
         resp = client.post(
@@ -935,24 +1109,20 @@ class TestUIMatchResult:
         assert resp.status_code == 200
         assert b"Complete" in resp.data
 
-    def test_ui_record_result_missing_winner(self, client):
-        div_id = _create_division(client).get_json()["id"]
-        _add_competitors(client, div_id, ["Alice", "Bob"])
-        _generate_bracket(client, div_id)
+    def test_ui_record_result_missing_winner(self, client, bracket_div_2c):
+        div_id = bracket_div_2c
 
-        match = Match.query.filter_by(division_id=div_id, round_name="Final").first()
+        match = _round_match_ids(div_id, "Final")
         resp = client.post(
             f"/ui/matches/{match.id}/result",
             data={"status": "Completed"},
         )
         assert resp.status_code == 400
 
-    def test_ui_record_result_disqualification(self, client):
-        div_id = _create_division(client).get_json()["id"]
-        _add_competitors(client, div_id, ["Alice", "Bob"])
-        _generate_bracket(client, div_id)
+    def test_ui_record_result_disqualification(self, client, bracket_div_2c):
+        div_id = bracket_div_2c
 
-        match = Match.query.filter_by(division_id=div_id, round_name="Final").first()
+        match = _round_match_ids(div_id, "Final")
         winner_id = match.competitor2_id
 
         resp = client.post(
@@ -961,13 +1131,11 @@ class TestUIMatchResult:
         )
         assert resp.status_code == 200
 
-    def test_ui_record_result_completed_includes_oob_notification(self, client):
+    def test_ui_record_result_completed_includes_oob_notification(self, client, bracket_div_2c):
         """Response should include OOB result notification and a lazy-load matches container."""
-        div_id = _create_division(client).get_json()["id"]
-        _add_competitors(client, div_id, ["Alice", "Bob"])
-        _generate_bracket(client, div_id)
+        div_id = bracket_div_2c
 
-        match = Match.query.filter_by(division_id=div_id, round_name="Final").first()
+        match = _round_match_ids(div_id, "Final")
         winner_id = match.competitor1_id
 
         resp = client.post(
@@ -982,13 +1150,11 @@ class TestUIMatchResult:
         assert b'hx-trigger="load"' in resp.data
         assert b'scorekeeper_matches' in resp.data
 
-    def test_ui_record_result_disqualification_includes_oob_notification(self, client):
+    def test_ui_record_result_disqualification_includes_oob_notification(self, client, bracket_div_2c):
         """Disqualification result should include OOB notification and lazy-load matches container."""
-        div_id = _create_division(client).get_json()["id"]
-        _add_competitors(client, div_id, ["Alice", "Bob"])
-        _generate_bracket(client, div_id)
+        div_id = bracket_div_2c
 
-        match = Match.query.filter_by(division_id=div_id, round_name="Final").first()
+        match = _round_match_ids(div_id, "Final")
         winner_id = match.competitor2_id
 
         resp = client.post(
@@ -1000,12 +1166,9 @@ class TestUIMatchResult:
         assert b'id="matches-container"' in resp.data
         assert b'hx-trigger="load"' in resp.data
 
-    def test_ui_record_result_completed_refreshes_bracket_advancement(self, client):
+    def test_ui_record_result_completed_refreshes_bracket_advancement(self, client, bracket_div_4c, ring_id):
         """After a match completes, the scorekeeper_matches endpoint should show the advanced winner."""
-        ring_id = _create_ring(client, "Ring 1").get_json()["id"]
-        div_id = _create_division(client).get_json()["id"]
-        _add_competitors(client, div_id, ["Alice", "Bob", "Carol", "Dave"])
-        _generate_bracket(client, div_id)
+        div_id = bracket_div_4c
 
         # Assign ring to the division, then schedule all matches
         client.patch(f"/ui/divisions/{div_id}/bracket_ring", data={"ring_id": str(ring_id)})
@@ -1016,7 +1179,7 @@ class TestUIMatchResult:
                 data={"ring_sequence": str(seq)},
             )
 
-        first_match = Match.query.filter_by(division_id=div_id, round_name="Semi-Final").first()
+        first_match = _round_match_ids(div_id, "Semi-Final")
         winner = db.session.get(Competitor, first_match.competitor1_id)
 
         resp = client.post(
@@ -1035,11 +1198,9 @@ class TestUIMatchResult:
         assert matches_resp.status_code == 200
         assert winner.name.encode() in matches_resp.data
 
-    def test_ui_record_result_final_match_shows_gold_message(self, client):
+    def test_ui_record_result_final_match_shows_gold_message(self, client, bracket_div_4c):
         """Completing the Final match should show 'wins gold!' instead of 'advances'."""
-        div_id = _create_division(client).get_json()["id"]
-        _add_competitors(client, div_id, ["Alice", "Bob", "Carol", "Dave"])
-        _generate_bracket(client, div_id)
+        div_id = bracket_div_4c
 
         # Complete both Semi-Final matches so the Final's competitors are populated
         semi_final_matches = Match.query.filter_by(division_id=div_id, round_name="Semi-Final").all()
@@ -1070,8 +1231,8 @@ class TestUIMatchResult:
         )
         assert resp.status_code == 404
 
-    def test_ui_record_result_tbd_competitor_rejected(self, client):
-        div_id = _create_division(client).get_json()["id"]
+    def test_ui_record_result_tbd_competitor_rejected(self, client, division_id):
+        div_id = division_id
         _add_competitors(client, div_id, ["Alice", "Bob", "Carol"])
         _generate_bracket(client, div_id)
 
@@ -1087,12 +1248,9 @@ class TestUIMatchResult:
         )
         assert resp.status_code == 400
 
-    def test_ui_record_result_in_progress_conflict_blocked(self, client):
+    def test_ui_record_result_in_progress_conflict_blocked(self, client, bracket_div_4c, ring_id):
         """Starting a match while another is In Progress on the same ring triggers an error response."""
-        ring_id = _create_ring(client, "Ring 1").get_json()["id"]
-        div_id = _create_division(client).get_json()["id"]
-        _add_competitors(client, div_id, ["Alice", "Bob", "Carol", "Dave"])
-        _generate_bracket(client, div_id)
+        div_id = bracket_div_4c
 
         matches = (
             Match.query.filter_by(division_id=div_id, status="Pending")
@@ -1178,11 +1336,9 @@ class TestUIMatchResult:
     # Time tracking
     # ------------------------------------------------------------------
 
-    def test_start_time_set_when_in_progress(self, client):
+    def test_start_time_set_when_in_progress(self, client, bracket_div_2c):
         """start_time is recorded when a match is set to In Progress."""
-        div_id = _create_division(client).get_json()["id"]
-        _add_competitors(client, div_id, ["Alice", "Bob"])
-        _generate_bracket(client, div_id)
+        div_id = bracket_div_2c
 
         match = Match.query.filter_by(division_id=div_id, round_name="Final").first()
         assert match.start_time is None
@@ -1193,11 +1349,9 @@ class TestUIMatchResult:
         assert match.start_time is not None
         assert match.end_time is None
 
-    def test_end_time_set_when_completed_after_start(self, client):
+    def test_end_time_set_when_completed_after_start(self, client, bracket_div_2c):
         """end_time is recorded when a started match is completed."""
-        div_id = _create_division(client).get_json()["id"]
-        _add_competitors(client, div_id, ["Alice", "Bob"])
-        _generate_bracket(client, div_id)
+        div_id = bracket_div_2c
 
         match = Match.query.filter_by(division_id=div_id, round_name="Final").first()
         winner_id = match.competitor1_id
@@ -1213,11 +1367,9 @@ class TestUIMatchResult:
         assert match.end_time is not None
         assert match.end_time >= match.start_time
 
-    def test_end_time_not_set_for_disqualification_without_start(self, client):
+    def test_end_time_not_set_for_disqualification_without_start(self, client, bracket_div_2c):
         """Neither start_time nor end_time is set when DSQ is issued without starting."""
-        div_id = _create_division(client).get_json()["id"]
-        _add_competitors(client, div_id, ["Alice", "Bob"])
-        _generate_bracket(client, div_id)
+        div_id = bracket_div_2c
 
         match = Match.query.filter_by(division_id=div_id, round_name="Final").first()
         winner_id = match.competitor1_id
@@ -1231,11 +1383,9 @@ class TestUIMatchResult:
         assert match.start_time is None
         assert match.end_time is None
 
-    def test_end_time_set_for_disqualification_after_start(self, client):
+    def test_end_time_set_for_disqualification_after_start(self, client, bracket_div_2c):
         """end_time is recorded when a DSQ is issued after the match has started."""
-        div_id = _create_division(client).get_json()["id"]
-        _add_competitors(client, div_id, ["Alice", "Bob"])
-        _generate_bracket(client, div_id)
+        div_id = bracket_div_2c
 
         match = Match.query.filter_by(division_id=div_id, round_name="Final").first()
         winner_id = match.competitor1_id
@@ -1257,12 +1407,9 @@ class TestUIMatchResult:
 
 
 class TestScorekeeperMatchesFragment:
-    def test_scorekeeper_matches_returns_pending_matches(self, client):
+    def test_scorekeeper_matches_returns_pending_matches(self, client, bracket_div_2c, ring_id):
         """Fragment endpoint returns pending kyorugi matches for the ring."""
-        ring_id = _create_ring(client, "Ring 1").get_json()["id"]
-        div_id = _create_division(client).get_json()["id"]
-        _add_competitors(client, div_id, ["Alice", "Bob"])
-        _generate_bracket(client, div_id)
+        div_id = bracket_div_2c
 
         client.patch(f"/ui/divisions/{div_id}/bracket_ring", data={"ring_id": str(ring_id)})
         match = Match.query.filter_by(division_id=div_id, status="Pending").first()
@@ -1272,12 +1419,9 @@ class TestScorekeeperMatchesFragment:
         assert resp.status_code == 200
         assert b"Start" in resp.data
 
-    def test_scorekeeper_matches_excludes_completed(self, client):
+    def test_scorekeeper_matches_excludes_completed(self, client, bracket_div_2c, ring_id):
         """Completed matches are not returned by the fragment endpoint."""
-        ring_id = _create_ring(client, "Ring 1").get_json()["id"]
-        div_id = _create_division(client).get_json()["id"]
-        _add_competitors(client, div_id, ["Alice", "Bob"])
-        _generate_bracket(client, div_id)
+        div_id = bracket_div_2c
 
         client.patch(f"/ui/divisions/{div_id}/bracket_ring", data={"ring_id": str(ring_id)})
         match = Match.query.filter_by(division_id=div_id, round_name="Final").first()
@@ -1298,19 +1442,16 @@ class TestScorekeeperMatchesFragment:
         resp = client.get("/ui/rings/9999/scorekeeper_matches")
         assert resp.status_code == 404
 
-    def test_scorekeeper_matches_shows_bracket_advancement(self, client):
+    def test_scorekeeper_matches_shows_bracket_advancement(self, client, bracket_div_4c, ring_id):
         """After a semi-final completes, the winner appears in the next match card."""
-        ring_id = _create_ring(client, "Ring 1").get_json()["id"]
-        div_id = _create_division(client).get_json()["id"]
-        _add_competitors(client, div_id, ["Alice", "Bob", "Carol", "Dave"])
-        _generate_bracket(client, div_id)
+        div_id = bracket_div_4c
 
         client.patch(f"/ui/divisions/{div_id}/bracket_ring", data={"ring_id": str(ring_id)})
         all_matches = Match.query.filter_by(division_id=div_id).order_by(Match.match_number).all()
         for seq, m in enumerate(all_matches, start=1):
             client.put(f"/matches/{m.id}/schedule", data={"ring_sequence": str(seq)})
 
-        first_match = Match.query.filter_by(division_id=div_id, round_name="Semi-Final").first()
+        first_match = _round_match_ids(div_id, "Semi-Final")
         winner = db.session.get(Competitor, first_match.competitor1_id)
 
         client.post(
@@ -1329,11 +1470,8 @@ class TestScorekeeperMatchesFragment:
 
 
 class TestMatchSchedule:
-    def test_schedule_match(self, client):
-        ring_id = _create_ring(client, "Ring 1").get_json()["id"]
-        div_id = _create_division(client).get_json()["id"]
-        _add_competitors(client, div_id, ["Alice", "Bob"])
-        _generate_bracket(client, div_id)
+    def test_schedule_match(self, client, bracket_div_2c, ring_id):
+        div_id = bracket_div_2c
 
         # Assign ring to the division first
         client.patch(f"/ui/divisions/{div_id}/bracket_ring", data={"ring_id": str(ring_id)})
@@ -1353,11 +1491,9 @@ class TestMatchSchedule:
         )
         assert resp.status_code == 404
 
-    def test_schedule_match_no_ring_on_division(self, client):
+    def test_schedule_match_no_ring_on_division(self, client, bracket_div_2c):
         _create_ring(client, "Ring 1")
-        div_id = _create_division(client).get_json()["id"]
-        _add_competitors(client, div_id, ["Alice", "Bob"])
-        _generate_bracket(client, div_id)
+        div_id = bracket_div_2c
 
         match = Match.query.filter_by(division_id=div_id).first()
         # No ring assigned to division — should return error in card
@@ -1370,8 +1506,7 @@ class TestMatchSchedule:
         assert b"No ring assigned" in resp.data
         assert match.match_number is None
 
-    def test_schedule_duplicate_match_number(self, client):
-        ring_id = _create_ring(client, "Ring 1").get_json()["id"]
+    def test_schedule_duplicate_match_number(self, client, ring_id):
         div_id1 = _create_division(client, "Male - Black Belt - Under 70kg").get_json()["id"]
         div_id2 = _create_division(client, "Female - Black Belt - Under 60kg").get_json()["id"]
         _add_competitors(client, div_id1, ["Alice", "Bob"])
@@ -1403,11 +1538,8 @@ class TestMatchSchedule:
         assert b"Error" in resp2.data
         assert match2.match_number is None
 
-    def test_schedule_match_sequence_out_of_range(self, client):
-        ring_id = _create_ring(client, "Ring 1").get_json()["id"]
-        div_id = _create_division(client).get_json()["id"]
-        _add_competitors(client, div_id, ["Alice", "Bob"])
-        _generate_bracket(client, div_id)
+    def test_schedule_match_sequence_out_of_range(self, client, bracket_div_2c, ring_id):
+        div_id = bracket_div_2c
 
         # Assign ring to the division first
         client.patch(f"/ui/divisions/{div_id}/bracket_ring", data={"ring_id": str(ring_id)})
@@ -1421,18 +1553,16 @@ class TestMatchSchedule:
 
 
 class TestBracketRingAssignment:
-    def test_bracket_ring_assign(self, client):
-        ring_id = _create_ring(client, "Ring 1").get_json()["id"]
+    def test_bracket_ring_assign(self, client, ring_id):
         div_id = _create_division(client).get_json()["id"]
         resp = client.patch(f"/ui/divisions/{div_id}/bracket_ring", data={"ring_id": str(ring_id)})
         assert resp.status_code == 200
         assert b"Ring 1" in resp.data
         from app import Division
-        division = Division.query.get(div_id)
+        division = db.session.get(Division, div_id)
         assert division.ring_id == ring_id
 
-    def test_bracket_ring_unassign(self, client):
-        ring_id = _create_ring(client, "Ring 1").get_json()["id"]
+    def test_bracket_ring_unassign(self, client, ring_id):
         div_id = _create_division(client).get_json()["id"]
         # Assign first
         client.patch(f"/ui/divisions/{div_id}/bracket_ring", data={"ring_id": str(ring_id)})
@@ -1440,29 +1570,27 @@ class TestBracketRingAssignment:
         resp = client.patch(f"/ui/divisions/{div_id}/bracket_ring", data={"ring_id": ""})
         assert resp.status_code == 200
         from app import Division
-        division = Division.query.get(div_id)
+        division = db.session.get(Division, div_id)
         assert division.ring_id is None
 
     def test_bracket_ring_not_found(self, client):
         resp = client.patch("/ui/divisions/9999/bracket_ring", data={"ring_id": "1"})
         assert resp.status_code == 404
 
-    def test_bracket_ring_invalid_value(self, client):
-        div_id = _create_division(client).get_json()["id"]
+    def test_bracket_ring_invalid_value(self, client, division_id):
+        div_id = division_id
         resp = client.patch(f"/ui/divisions/{div_id}/bracket_ring", data={"ring_id": "notanumber"})
         assert resp.status_code == 400
 
-    def test_bracket_ring_nonexistent_ring(self, client):
-        div_id = _create_division(client).get_json()["id"]
+    def test_bracket_ring_nonexistent_ring(self, client, division_id):
+        div_id = division_id
         resp = client.patch(f"/ui/divisions/{div_id}/bracket_ring", data={"ring_id": "99999"})
         assert resp.status_code == 404
 
-    def test_bracket_ring_change_clears_scheduled_matches(self, client):
+    def test_bracket_ring_change_clears_scheduled_matches(self, client, bracket_div_2c):
         ring1_id = _create_ring(client, "Ring 1").get_json()["id"]
         ring2_id = _create_ring(client, "Ring 2").get_json()["id"]
-        div_id = _create_division(client).get_json()["id"]
-        _add_competitors(client, div_id, ["Alice", "Bob"])
-        _generate_bracket(client, div_id)
+        div_id = bracket_div_2c
         # Assign ring 1 and schedule a match
         client.patch(f"/ui/divisions/{div_id}/bracket_ring", data={"ring_id": str(ring1_id)})
         match = Match.query.filter_by(division_id=div_id).first()
@@ -1478,11 +1606,8 @@ class TestBracketRingAssignment:
         assert match.ring_id is None
         assert match.match_number is None
 
-    def test_bracket_ring_unassign_clears_scheduled_matches(self, client):
-        ring_id = _create_ring(client, "Ring 1").get_json()["id"]
-        div_id = _create_division(client).get_json()["id"]
-        _add_competitors(client, div_id, ["Alice", "Bob"])
-        _generate_bracket(client, div_id)
+    def test_bracket_ring_unassign_clears_scheduled_matches(self, client, bracket_div_2c, ring_id):
+        div_id = bracket_div_2c
         # Assign ring and schedule a match
         client.patch(f"/ui/divisions/{div_id}/bracket_ring", data={"ring_id": str(ring_id)})
         match = Match.query.filter_by(division_id=div_id).first()
@@ -1498,11 +1623,9 @@ class TestBracketRingAssignment:
         assert match.ring_id is None
         assert match.match_number is None
 
-    def test_bracket_manage_page_shows_ring_assignment(self, client):
+    def test_bracket_manage_page_shows_ring_assignment(self, client, bracket_div_2c):
         ring_id = _create_ring(client, "Ring 2").get_json()["id"]
-        div_id = _create_division(client).get_json()["id"]
-        _add_competitors(client, div_id, ["Alice", "Bob"])
-        _generate_bracket(client, div_id)
+        div_id = bracket_div_2c
         # Assign ring at bracket level
         client.patch(f"/ui/divisions/{div_id}/bracket_ring", data={"ring_id": str(ring_id)})
         resp = client.get(f"/admin/divisions/{div_id}/bracket_manage")
@@ -1531,11 +1654,8 @@ class TestPageRoutes:
         assert b'name="viewport"' in resp.data
         assert b'width=device-width' in resp.data
 
-    def test_admin_schedule_page_lists_divisions_with_matches(self, client):
-        ring_id = _create_ring(client, "Ring 1").get_json()["id"]
-        div_id = _create_division(client, "Div A").get_json()["id"]
-        _add_competitors(client, div_id, ["Alice", "Bob"])
-        _generate_bracket(client, div_id)
+    def test_admin_schedule_page_lists_divisions_with_matches(self, client, ring_id, make_bracket_division):
+        div_id = make_bracket_division(["Alice", "Bob"], "Div A")
         client.patch(f"/ui/divisions/{div_id}/bracket_ring", data={"ring_id": str(ring_id)})
 
         resp = client.get("/admin/schedule")
@@ -1543,50 +1663,34 @@ class TestPageRoutes:
         assert b"Match Schedule" in resp.data
         assert b"Div A" in resp.data
 
-    def test_admin_schedule_ring_filter_no_ring(self, client):
-        ring_id = _create_ring(client, "Ring 1").get_json()["id"]
-
-        div_with_ring = _create_division(client, "Div With Ring").get_json()["id"]
-        _add_competitors(client, div_with_ring, ["A", "B"])
-        _generate_bracket(client, div_with_ring)
+    def test_admin_schedule_ring_filter_no_ring(self, client, ring_id, make_bracket_division):
+        div_with_ring = make_bracket_division(["A", "B"], "Div With Ring")
         client.patch(f"/ui/divisions/{div_with_ring}/bracket_ring", data={"ring_id": str(ring_id)})
 
-        div_no_ring = _create_division(client, "Div No Ring").get_json()["id"]
-        _add_competitors(client, div_no_ring, ["C", "D"])
-        _generate_bracket(client, div_no_ring)
+        div_no_ring = make_bracket_division(["C", "D"], "Div No Ring")
 
         resp = client.get("/admin/schedule?ring_id=none")
         assert resp.status_code == 200
         assert b"Div No Ring" in resp.data
         assert b"Div With Ring" not in resp.data
 
-    def test_admin_schedule_event_type_filter(self, client):
-        kyorugi_div_id = _create_division(client, "Kyorugi Div", event_type="kyorugi").get_json()["id"]
-        _add_competitors(client, kyorugi_div_id, ["A", "B"])
-        _generate_bracket(client, kyorugi_div_id)
+    def test_admin_schedule_event_type_filter(self, client, make_bracket_division):
+        kyorugi_div_id = make_bracket_division(["A", "B"], "Kyorugi Div", event_type="kyorugi")
 
-        poomsae_div_id = _create_division(client, "Poomsae Div", event_type="poomsae").get_json()["id"]
-        _add_competitors(client, poomsae_div_id, ["C", "D"])
-        _generate_bracket(client, poomsae_div_id)
+        poomsae_div_id = make_bracket_division(["C", "D"], "Poomsae Div", event_type="poomsae")
 
         resp = client.get("/admin/schedule?event_type=poomsae")
         assert resp.status_code == 200
         assert b"Poomsae Div" in resp.data
         assert b"Kyorugi Div" not in resp.data
 
-    def test_admin_schedule_bracket_sorted_by_min_match_sequence(self, client):
+    def test_admin_schedule_bracket_sorted_by_min_match_sequence(self, client, ring_id, make_bracket_division):
         """Bracket divisions should be sorted by their lowest scheduled match sequence."""
-        ring_id = _create_ring(client, "Ring 1").get_json()["id"]
-
         # Create two bracket divisions and assign them to the same ring
-        div_a_id = _create_division(client, "Div A").get_json()["id"]
-        _add_competitors(client, div_a_id, ["A1", "A2"])
-        _generate_bracket(client, div_a_id)
+        div_a_id = make_bracket_division(["A1", "A2"], "Div A")
         client.patch(f"/ui/divisions/{div_a_id}/bracket_ring", data={"ring_id": str(ring_id)})
 
-        div_b_id = _create_division(client, "Div B").get_json()["id"]
-        _add_competitors(client, div_b_id, ["B1", "B2"])
-        _generate_bracket(client, div_b_id)
+        div_b_id = make_bracket_division(["B1", "B2"], "Div B")
         client.patch(f"/ui/divisions/{div_b_id}/bracket_ring", data={"ring_id": str(ring_id)})
 
         # Schedule Div B's match at sequence 1 and Div A's match at sequence 2
@@ -1601,22 +1705,16 @@ class TestPageRoutes:
         # Div B (sequence 1) should appear before Div A (sequence 2)
         assert html.index("Div B") < html.index("Div A")
 
-    def test_admin_schedule_poomsae_before_kyorugi(self, client):
+    def test_admin_schedule_poomsae_before_kyorugi(self, client, ring_id, make_bracket_division):
         """All poomsae divisions should appear before all kyorugi, regardless of sequence."""
-        ring_id = _create_ring(client, "Ring 1").get_json()["id"]
-
         # Kyorugi at sequence 1
-        kyorugi_id = _create_division(client, "Kyorugi Div", event_type="kyorugi").get_json()["id"]
-        _add_competitors(client, kyorugi_id, ["A", "B"])
-        _generate_bracket(client, kyorugi_id)
+        kyorugi_id = make_bracket_division(["A", "B"], "Kyorugi Div", event_type="kyorugi")
         client.patch(f"/ui/divisions/{kyorugi_id}/bracket_ring", data={"ring_id": str(ring_id)})
         kyorugi_match = Match.query.filter_by(division_id=kyorugi_id).first()
         client.put(f"/matches/{kyorugi_match.id}/schedule", data={"ring_sequence": "1"})
 
         # Poomsae at sequence 2 (higher than kyorugi — but still must come first)
-        poomsae_id = _create_division(client, "Poomsae Div", event_type="poomsae").get_json()["id"]
-        _add_competitors(client, poomsae_id, ["C", "D"])
-        _generate_bracket(client, poomsae_id)
+        poomsae_id = make_bracket_division(["C", "D"], "Poomsae Div", event_type="poomsae")
         client.patch(f"/ui/divisions/{poomsae_id}/bracket_ring", data={"ring_id": str(ring_id)})
         poomsae_match = Match.query.filter_by(division_id=poomsae_id).first()
         client.put(f"/matches/{poomsae_match.id}/schedule", data={"ring_sequence": "2"})
@@ -1627,8 +1725,8 @@ class TestPageRoutes:
         # Poomsae Div (seq 2) should still appear before Kyorugi Div (seq 1)
         assert html.index("Poomsae Div") < html.index("Kyorugi Div")
 
-    def test_admin_division_setup(self, client):
-        div_id = _create_division(client).get_json()["id"]
+    def test_admin_division_setup(self, client, division_id):
+        div_id = division_id
         resp = client.get(f"/admin/divisions/{div_id}/setup")
         assert resp.status_code == 200
         assert b'id="htmx-confirm-modal"' in resp.data
@@ -1640,23 +1738,21 @@ class TestPageRoutes:
         resp = client.get("/admin/divisions/9999/setup")
         assert resp.status_code == 404
 
-    def test_ui_bracket_controls_no_competitors(self, client):
-        div_id = _create_division(client).get_json()["id"]
+    def test_ui_bracket_controls_no_competitors(self, client, division_id):
+        div_id = division_id
         resp = client.get(f"/ui/divisions/{div_id}/bracket_controls")
         assert resp.status_code == 200
         assert b"Add competitors above" in resp.data
 
-    def test_ui_bracket_controls_with_competitors(self, client):
-        div_id = _create_division(client).get_json()["id"]
+    def test_ui_bracket_controls_with_competitors(self, client, division_id):
+        div_id = division_id
         _add_competitors(client, div_id, ["Alice", "Bob"])
         resp = client.get(f"/ui/divisions/{div_id}/bracket_controls")
         assert resp.status_code == 200
         assert b"Generate Bracket" in resp.data
 
-    def test_ui_bracket_controls_with_bracket(self, client):
-        div_id = _create_division(client).get_json()["id"]
-        _add_competitors(client, div_id, ["Alice", "Bob"])
-        _generate_bracket(client, div_id)
+    def test_ui_bracket_controls_with_bracket(self, client, bracket_div_2c):
+        div_id = bracket_div_2c
         resp = client.get(f"/ui/divisions/{div_id}/bracket_controls")
         assert resp.status_code == 200
         assert b"Manage" in resp.data
@@ -1666,39 +1762,34 @@ class TestPageRoutes:
         resp = client.get("/ui/divisions/9999/bracket_controls")
         assert resp.status_code == 404
 
-    def test_ui_bracket_view(self, client):
-        div_id = _create_division(client).get_json()["id"]
+    def test_ui_bracket_view(self, client, division_id):
+        div_id = division_id
         resp = client.get(f"/ui/divisions/{div_id}/bracket")
         assert resp.status_code == 200
 
-    def test_bracket_ui_no_bracket(self, client):
-        div_id = _create_division(client).get_json()["id"]
+    def test_bracket_ui_no_bracket(self, client, division_id):
+        div_id = division_id
         resp = client.get(f"/divisions/{div_id}/bracket_ui")
         assert resp.status_code == 404
 
-    def test_bracket_ui_with_bracket(self, client):
-        div_id = _create_division(client).get_json()["id"]
-        _add_competitors(client, div_id, ["Alice", "Bob"])
-        _generate_bracket(client, div_id)
+    def test_bracket_ui_with_bracket(self, client, bracket_div_2c):
+        div_id = bracket_div_2c
 
         resp = client.get(f"/divisions/{div_id}/bracket_ui")
         assert resp.status_code == 200
+        assert b"Alice" in resp.data
 
-    def test_bracket_manage_page(self, client):
-        div_id = _create_division(client).get_json()["id"]
-        _add_competitors(client, div_id, ["Alice", "Bob"])
-        _generate_bracket(client, div_id)
+    def test_bracket_manage_page(self, client, bracket_div_2c):
+        div_id = bracket_div_2c
 
         resp = client.get(f"/admin/divisions/{div_id}/bracket_manage")
         assert resp.status_code == 200
         assert b'id="htmx-confirm-modal"' in resp.data
         assert b"htmx:confirm" in resp.data
 
-    def test_bracket_manage_round_order(self, client):
+    def test_bracket_manage_round_order(self, client, bracket_div_4c):
         """Rounds must appear left-to-right from earliest (most matches) to Final."""
-        div_id = _create_division(client).get_json()["id"]
-        _add_competitors(client, div_id, ["Alice", "Bob", "Carol", "Dave"])
-        _generate_bracket(client, div_id)
+        div_id = bracket_div_4c
 
         resp = client.get(f"/admin/divisions/{div_id}/bracket_manage")
         assert resp.status_code == 200
@@ -1757,10 +1848,8 @@ class TestPageRoutes:
         resp = client.get("/ui/results_divisions?event_type=invalid")
         assert resp.status_code == 400
 
-    def test_ui_results_divisions_bracket_link(self, client):
-        div_id = _create_division(client, "Test Div", "kyorugi").get_json()["id"]
-        _add_competitors(client, div_id, ["Alice", "Bob"])
-        _generate_bracket(client, div_id)
+    def test_ui_results_divisions_bracket_link(self, client, make_bracket_division):
+        div_id = make_bracket_division(["Alice", "Bob"], "Test Div", "kyorugi")
         resp = client.get("/ui/results_divisions?event_type=kyorugi")
         assert resp.status_code == 200
         assert f"/ui/divisions/{div_id}/bracket".encode() in resp.data
@@ -1771,20 +1860,16 @@ class TestPageRoutes:
         assert resp.status_code == 200
         assert b"No bracket" in resp.data
 
-    def test_ui_results_divisions_status_pending(self, client):
-        div_id = _create_division(client, "Pending Div", "kyorugi").get_json()["id"]
-        _add_competitors(client, div_id, ["Alice", "Bob"])
-        _generate_bracket(client, div_id)
+    def test_ui_results_divisions_status_pending(self, client, make_bracket_division):
+        div_id = make_bracket_division(["Alice", "Bob"], "Pending Div", "kyorugi")
         resp = client.get("/ui/results_divisions?event_type=kyorugi")
         assert resp.status_code == 200
         assert b"Pending" in resp.data
 
-    def test_ui_results_divisions_status_in_progress(self, client):
-        div_id = _create_division(client, "InProgress Div", "kyorugi").get_json()["id"]
-        _add_competitors(client, div_id, ["Alice", "Bob", "Carol", "Dave"])
-        _generate_bracket(client, div_id)
+    def test_ui_results_divisions_status_in_progress(self, client, make_bracket_division):
+        div_id = make_bracket_division(["Alice", "Bob", "Carol", "Dave"], "InProgress Div", "kyorugi")
         # Complete only one of the Semi-Final matches to get "In Progress" status
-        match = Match.query.filter_by(division_id=div_id, round_name="Semi-Final").first()
+        match = _round_match_ids(div_id, "Semi-Final")
         client.post(
             f"/ui/matches/{match.id}/result",
             data={"status": "Completed", "winner_id": match.competitor1_id},
@@ -1793,10 +1878,8 @@ class TestPageRoutes:
         assert resp.status_code == 200
         assert b"In Progress" in resp.data
 
-    def test_ui_results_divisions_status_completed(self, client):
-        div_id = _create_division(client, "Completed Div", "kyorugi").get_json()["id"]
-        _add_competitors(client, div_id, ["Alice", "Bob"])
-        _generate_bracket(client, div_id)
+    def test_ui_results_divisions_status_completed(self, client, make_bracket_division):
+        div_id = make_bracket_division(["Alice", "Bob"], "Completed Div", "kyorugi")
         match = Match.query.filter_by(division_id=div_id).first()
         client.post(
             f"/ui/matches/{match.id}/result",
@@ -1862,11 +1945,8 @@ class TestPublicSchedule:
         assert resp.status_code == 200
         assert b"Match Schedule" in resp.data
 
-    def test_public_schedule_shows_divisions_with_matches(self, client):
-        ring_id = _create_ring(client, "Ring 1").get_json()["id"]
-        div_id = _create_division(client, "Div A").get_json()["id"]
-        _add_competitors(client, div_id, ["Alice", "Bob"])
-        _generate_bracket(client, div_id)
+    def test_public_schedule_shows_divisions_with_matches(self, client, ring_id, make_bracket_division):
+        div_id = make_bracket_division(["Alice", "Bob"], "Div A")
         client.patch(f"/ui/divisions/{div_id}/bracket_ring", data={"ring_id": str(ring_id)})
 
         resp = client.get("/schedule")
@@ -1875,11 +1955,8 @@ class TestPublicSchedule:
         assert b"Alice" in resp.data
         assert b"Bob" in resp.data
 
-    def test_public_schedule_has_no_admin_controls(self, client):
-        ring_id = _create_ring(client, "Ring 1").get_json()["id"]
-        div_id = _create_division(client, "Div A").get_json()["id"]
-        _add_competitors(client, div_id, ["Alice", "Bob"])
-        _generate_bracket(client, div_id)
+    def test_public_schedule_has_no_admin_controls(self, client, ring_id, make_bracket_division):
+        div_id = make_bracket_division(["Alice", "Bob"], "Div A")
         client.patch(f"/ui/divisions/{div_id}/bracket_ring", data={"ring_id": str(ring_id)})
 
         resp = client.get("/schedule")
@@ -1890,50 +1967,36 @@ class TestPublicSchedule:
         # No scheduling form inputs
         assert b'hx-put="/matches/' not in resp.data
 
-    def test_public_schedule_search_filters_by_competitor_name(self, client):
-        div_id = _create_division(client, "Div A").get_json()["id"]
-        _add_competitors(client, div_id, ["Alice", "Bob"])
-        _generate_bracket(client, div_id)
+    def test_public_schedule_search_filters_by_competitor_name(self, client, make_bracket_division):
+        div_id = make_bracket_division(["Alice", "Bob"], "Div A")
 
         resp = client.get("/schedule?search=Alice")
         assert resp.status_code == 200
         assert b"Alice" in resp.data
         assert b"Div A" in resp.data
 
-    def test_public_schedule_search_no_match_shows_empty(self, client):
-        div_id = _create_division(client, "Div A").get_json()["id"]
-        _add_competitors(client, div_id, ["Alice", "Bob"])
-        _generate_bracket(client, div_id)
+    def test_public_schedule_search_no_match_shows_empty(self, client, make_bracket_division):
+        div_id = make_bracket_division(["Alice", "Bob"], "Div A")
 
         resp = client.get("/schedule?search=zzznomatch")
         assert resp.status_code == 200
         assert b"Div A" not in resp.data
 
-    def test_public_schedule_event_type_filter(self, client):
-        kyorugi_id = _create_division(client, "Kyorugi Div", event_type="kyorugi").get_json()["id"]
-        _add_competitors(client, kyorugi_id, ["A", "B"])
-        _generate_bracket(client, kyorugi_id)
+    def test_public_schedule_event_type_filter(self, client, make_bracket_division):
+        kyorugi_id = make_bracket_division(["A", "B"], "Kyorugi Div", event_type="kyorugi")
 
-        poomsae_id = _create_division(client, "Poomsae Div", event_type="poomsae").get_json()["id"]
-        _add_competitors(client, poomsae_id, ["C", "D"])
-        _generate_bracket(client, poomsae_id)
+        poomsae_id = make_bracket_division(["C", "D"], "Poomsae Div", event_type="poomsae")
 
         resp = client.get("/schedule?event_type=kyorugi")
         assert resp.status_code == 200
         assert b"Kyorugi Div" in resp.data
         assert b"Poomsae Div" not in resp.data
 
-    def test_public_schedule_ring_filter(self, client):
-        ring_id = _create_ring(client, "Ring 1").get_json()["id"]
-
-        div_with_ring = _create_division(client, "Div With Ring").get_json()["id"]
-        _add_competitors(client, div_with_ring, ["A", "B"])
-        _generate_bracket(client, div_with_ring)
+    def test_public_schedule_ring_filter(self, client, ring_id, make_bracket_division):
+        div_with_ring = make_bracket_division(["A", "B"], "Div With Ring")
         client.patch(f"/ui/divisions/{div_with_ring}/bracket_ring", data={"ring_id": str(ring_id)})
 
-        div_no_ring = _create_division(client, "Div No Ring").get_json()["id"]
-        _add_competitors(client, div_no_ring, ["C", "D"])
-        _generate_bracket(client, div_no_ring)
+        div_no_ring = make_bracket_division(["C", "D"], "Div No Ring")
 
         resp = client.get(f"/schedule?ring_id={ring_id}")
         assert resp.status_code == 200
@@ -1988,9 +2051,8 @@ class TestEventTypes:
         resp = client.get("/ui/divisions_list?event_type=unknown")
         assert resp.status_code == 400
 
-    def test_same_match_number_allowed_across_events(self, client):
+    def test_same_match_number_allowed_across_events(self, client, ring_id):
         """Match number 101 in kyorugi should not conflict with 101 in poomsae."""
-        ring_id = _create_ring(client, "Ring 1").get_json()["id"]
         div_kyorugi = _create_division(client, "Kyorugi Div", "kyorugi").get_json()["id"]
         div_poomsae = _create_division(client, "Poomsae Div", "poomsae").get_json()["id"]
         _add_competitors(client, div_kyorugi, ["Alice", "Bob"])
@@ -2025,9 +2087,8 @@ class TestEventTypes:
         db.session.refresh(match_p)
         assert match_p.match_number == (ring_id * 100) + 1
 
-    def test_duplicate_match_number_rejected_within_event(self, client):
+    def test_duplicate_match_number_rejected_within_event(self, client, ring_id):
         """Two matches in the same event cannot share a match number."""
-        ring_id = _create_ring(client, "Ring 1").get_json()["id"]
         div1 = _create_division(client, "Kyorugi A", "kyorugi").get_json()["id"]
         div2 = _create_division(client, "Kyorugi B", "kyorugi").get_json()["id"]
         _add_competitors(client, div1, ["Alice", "Bob"])
@@ -2058,8 +2119,7 @@ class TestEventTypes:
         db.session.refresh(match2)
         assert match2.match_number is None
 
-    def test_ring_scorekeeper(self, client):
-        ring_id = _create_ring(client, "Ring 1").get_json()["id"]
+    def test_ring_scorekeeper(self, client, ring_id):
         resp = client.get(f"/ring/{ring_id}/scorekeeper")
         assert resp.status_code == 200
         assert b'id="htmx-confirm-modal"' in resp.data
@@ -2070,9 +2130,8 @@ class TestEventTypes:
         resp = client.get("/ring/9999/scorekeeper")
         assert resp.status_code == 404
 
-    def test_ring_scorekeeper_shows_tbd_matches(self, client):
+    def test_ring_scorekeeper_shows_tbd_matches(self, client, ring_id):
         """Matches with a TBD competitor should still appear on the scorekeeper page."""
-        ring_id = _create_ring(client, "Ring 1").get_json()["id"]
         div_id = _create_division(client).get_json()["id"]
         # 3 competitors causes a bye, so one semi-final match will have a TBD slot
         _add_competitors(client, div_id, ["Alice", "Bob", "Carol"])
@@ -2090,12 +2149,9 @@ class TestEventTypes:
         assert resp.status_code == 200
         assert b"TBD" in resp.data
 
-    def test_ring_scorekeeper_tbd_submit_disabled(self, client):
+    def test_ring_scorekeeper_tbd_submit_disabled(self, client, ring_id, make_bracket_division):
         """Action buttons should be disabled when a competitor is TBD."""
-        ring_id = _create_ring(client, "Ring 1").get_json()["id"]
-        div_id = _create_division(client).get_json()["id"]
-        _add_competitors(client, div_id, ["Alice", "Bob", "Carol"])
-        _generate_bracket(client, div_id)
+        div_id = make_bracket_division(["Alice", "Bob", "Carol"])
 
         # Find a Pending match with a TBD slot (excludes Completed (Bye) matches)
         tbd_match = Match.query.filter_by(division_id=div_id, status="Pending").filter(
@@ -2115,12 +2171,9 @@ class TestEventTypes:
         # Winner-required action button should be disabled for TBD match
         assert b'class="submit-btn" disabled' in resp.data
 
-    def test_ring_scorekeeper_no_tbd_submit_enabled(self, client):
+    def test_ring_scorekeeper_no_tbd_submit_enabled(self, client, bracket_div_2c, ring_id):
         """Start should be enabled while winner-required actions begin disabled until a winner is selected."""
-        ring_id = _create_ring(client, "Ring 1").get_json()["id"]
-        div_id = _create_division(client).get_json()["id"]
-        _add_competitors(client, div_id, ["Alice", "Bob"])
-        _generate_bracket(client, div_id)
+        div_id = bracket_div_2c
 
         match = Match.query.filter_by(division_id=div_id).first()
         client.patch(f"/ui/divisions/{div_id}/bracket_ring", data={"ring_id": str(ring_id)})
@@ -2135,8 +2188,7 @@ class TestEventTypes:
         assert b'class="submit-btn"' in resp.data
         assert b'class="submit-btn dsq-btn winner-required" disabled' in resp.data
 
-    def test_ring_scorekeeper_filters_by_event_type(self, client):
-        ring_id = _create_ring(client, "Ring 1").get_json()["id"]
+    def test_ring_scorekeeper_filters_by_event_type(self, client, ring_id):
         div_kyorugi = _create_division(client, "Kyorugi Division", "kyorugi").get_json()["id"]
         div_poomsae = _create_division(client, "Poomsae Division", "poomsae").get_json()["id"]
 
@@ -2172,8 +2224,7 @@ class TestEventTypes:
         assert b"Poomsae Division" in resp_p.data
         assert b"Kyorugi Division" not in resp_p.data
 
-    def test_ring_scorekeeper_invalid_event_type(self, client):
-        ring_id = _create_ring(client, "Ring 1").get_json()["id"]
+    def test_ring_scorekeeper_invalid_event_type(self, client, ring_id):
         resp = client.get(f"/ring/{ring_id}/scorekeeper?event_type=unknown")
         assert resp.status_code == 400
 
@@ -2193,21 +2244,17 @@ class TestMedalPlacements:
             json={"status": "Completed", "winner_id": winner_id},
         )
 
-    def test_no_placements_before_bracket_complete(self, client):
+    def test_no_placements_before_bracket_complete(self, client, bracket_div_2c):
         """Medal table should NOT appear while matches are still pending."""
-        div_id = _create_division(client).get_json()["id"]
-        _add_competitors(client, div_id, ["Alice", "Bob"])
-        _generate_bracket(client, div_id)
+        div_id = bracket_div_2c
 
         resp = client.get(f"/divisions/{div_id}/bracket_ui")
         assert resp.status_code == 200
         assert b"Medal Placements" not in resp.data
 
-    def test_placements_two_competitors(self, client):
+    def test_placements_two_competitors(self, client, bracket_div_2c):
         """2-competitor bracket: 1st and 2nd shown; no 3rd place entries."""
-        div_id = _create_division(client).get_json()["id"]
-        _add_competitors(client, div_id, ["Alice", "Bob"])
-        _generate_bracket(client, div_id)
+        div_id = bracket_div_2c
 
         match = Match.query.filter_by(division_id=div_id).first()
         winner_id = match.competitor1_id
@@ -2225,7 +2272,7 @@ class TestMedalPlacements:
         assert loser.name.encode() in resp.data
         assert b"3rd Place" not in resp.data
 
-    def test_placements_four_competitors(self, client):
+    def test_placements_four_competitors(self, client, bracket_div_4c):
         """4-competitor bracket (Semi-Final → Final):
         both Semi-Final losers appear as 3rd place.
 
@@ -2236,9 +2283,7 @@ class TestMedalPlacements:
         The two Semi-Final losers are the bronze medalists (their matches feed
         directly into the championship via next_match_id).
         """
-        div_id = _create_division(client).get_json()["id"]
-        _add_competitors(client, div_id, ["Alice", "Bob", "Carol", "Dave"])
-        _generate_bracket(client, div_id)
+        div_id = bracket_div_4c
 
         r1_matches = Match.query.filter_by(division_id=div_id, round_name="Semi-Final").all()
         assert len(r1_matches) == 2
@@ -2281,7 +2326,7 @@ class TestMedalPlacements:
         for loser_name in r1_loser_names:
             assert loser_name.encode() in resp.data
 
-    def test_placements_with_semifinals(self, client):
+    def test_placements_with_semifinals(self, client, division_id):
         """Bracket with Quarter-Finals (5 competitors → 3 byes in Quarter-Final round):
         all four placements are shown after the Final is completed.
 
@@ -2295,7 +2340,7 @@ class TestMedalPlacements:
           SF_2: Carol vs Dave
         Final: SF_1 winner vs SF_2 winner
         """
-        div_id = _create_division(client).get_json()["id"]
+        div_id = division_id
         _add_competitors(client, div_id, ["Alice", "Bob", "Carol", "Dave", "Eve"])
         _generate_bracket(client, div_id)
 
@@ -2361,11 +2406,9 @@ class TestMedalPlacements:
 class TestBracketDisplayLayout:
     """Tests for _build_bracket_display and _extract_bracket_half helpers."""
 
-    def test_bracket_ui_two_competitors_single_center_column(self, client):
+    def test_bracket_ui_two_competitors_single_center_column(self, client, bracket_div_2c):
         """2-competitor bracket: just a Final column, no left/right columns."""
-        div_id = _create_division(client).get_json()["id"]
-        _add_competitors(client, div_id, ["Alice", "Bob"])
-        _generate_bracket(client, div_id)
+        div_id = bracket_div_2c
 
         resp = client.get(f"/divisions/{div_id}/bracket_ui")
         assert resp.status_code == 200
@@ -2373,9 +2416,9 @@ class TestBracketDisplayLayout:
         titles = re.findall(r'<h3 class="round-title">([^<]+)</h3>', html)
         assert titles == ["Final"]
 
-    def test_bracket_ui_four_competitors_three_columns(self, client):
+    def test_bracket_ui_four_competitors_three_columns(self, client, division_id):
         """4-competitor bracket: Semi-Final | Final | Semi-Final (3 columns)."""
-        div_id = _create_division(client).get_json()["id"]
+        div_id = division_id
         _add_competitors(client, div_id, ["A", "B", "C", "D"])
         _generate_bracket(client, div_id)
 
@@ -2385,9 +2428,9 @@ class TestBracketDisplayLayout:
         titles = re.findall(r'<h3 class="round-title">([^<]+)</h3>', html)
         assert titles == ["Semi-Final", "Final", "Semi-Final"]
 
-    def test_bracket_ui_eight_competitors_five_columns(self, client):
+    def test_bracket_ui_eight_competitors_five_columns(self, client, division_id):
         """8-competitor bracket: Quarter-Final | Semi-Final | Final | Semi-Final | Quarter-Final."""
-        div_id = _create_division(client).get_json()["id"]
+        div_id = division_id
         _add_competitors(client, div_id, ["A", "B", "C", "D", "E", "F", "G", "H"])
         _generate_bracket(client, div_id)
 
@@ -2397,9 +2440,9 @@ class TestBracketDisplayLayout:
         titles = re.findall(r'<h3 class="round-title">([^<]+)</h3>', html)
         assert titles == ["Quarter-Final", "Semi-Final", "Final", "Semi-Final", "Quarter-Final"]
 
-    def test_bracket_ui_sixteen_competitors_seven_columns(self, client):
+    def test_bracket_ui_sixteen_competitors_seven_columns(self, client, division_id):
         """16-competitor bracket has 7 columns: Round of 16 | QF | SF | F | SF | QF | Round of 16."""
-        div_id = _create_division(client).get_json()["id"]
+        div_id = division_id
         _add_competitors(client, div_id, [str(i) for i in range(1, 17)])
         _generate_bracket(client, div_id)
 
@@ -2413,9 +2456,9 @@ class TestBracketDisplayLayout:
             "Semi-Final", "Quarter-Final", "Round of 16",
         ]
 
-    def test_bracket_ui_columns_are_symmetric(self, client):
+    def test_bracket_ui_columns_are_symmetric(self, client, division_id):
         """Left and right halves should be mirror images (same round names)."""
-        div_id = _create_division(client).get_json()["id"]
+        div_id = division_id
         _add_competitors(client, div_id, ["A", "B", "C", "D", "E", "F", "G", "H"])
         _generate_bracket(client, div_id)
 
@@ -2439,8 +2482,7 @@ class TestBracketDisplayLayout:
 class TestPoomsaeRingAssignment:
     """Tests for assigning a poomsae division to a ring (PATCH /ui/divisions/<id>/ring_assignment)."""
 
-    def test_poomsae_ring_assignment_saves(self, client):
-        ring_id = _create_ring(client, "Ring 1").get_json()["id"]
+    def test_poomsae_ring_assignment_saves(self, client, ring_id):
         div_id = _create_division(client, "World Class Poomsae", "poomsae").get_json()["id"]
 
         resp = client.patch(
@@ -2454,8 +2496,7 @@ class TestPoomsaeRingAssignment:
         assert div.ring_id == ring_id
         assert div.event_status == "In Progress"
 
-    def test_poomsae_ring_assignment_unassign(self, client):
-        ring_id = _create_ring(client, "Ring 1").get_json()["id"]
+    def test_poomsae_ring_assignment_unassign(self, client, ring_id):
         div_id = _create_division(client, "Poomsae Div", "poomsae").get_json()["id"]
 
         client.patch(
@@ -2490,8 +2531,7 @@ class TestPoomsaeRingAssignment:
         )
         assert resp.status_code == 404
 
-    def test_poomsae_ring_assignment_returns_controls_fragment(self, client):
-        ring_id = _create_ring(client, "Ring 1").get_json()["id"]
+    def test_poomsae_ring_assignment_returns_controls_fragment(self, client, ring_id):
         div_id = _create_division(client, "Poomsae Div", "poomsae").get_json()["id"]
         _set_poomsae_style(client, div_id, "group")
 
@@ -2575,8 +2615,7 @@ class TestPoomsaeRingAssignment:
 class TestPoomsaeRingSequence:
     """Tests for ring_sequence ordering of poomsae divisions within a ring."""
 
-    def test_ring_assignment_saves_ring_sequence(self, client):
-        ring_id = _create_ring(client, "Ring 1").get_json()["id"]
+    def test_ring_assignment_saves_ring_sequence(self, client, ring_id):
         div_id = _create_division(client, "Poomsae Div", "poomsae").get_json()["id"]
 
         resp = client.patch(
@@ -2589,8 +2628,7 @@ class TestPoomsaeRingSequence:
         div = db.session.get(Division, div_id)
         assert div.ring_sequence == 2
 
-    def test_ring_assignment_clears_ring_sequence(self, client):
-        ring_id = _create_ring(client, "Ring 1").get_json()["id"]
+    def test_ring_assignment_clears_ring_sequence(self, client, ring_id):
         div_id = _create_division(client, "Poomsae Div", "poomsae").get_json()["id"]
 
         client.patch(
@@ -2606,8 +2644,7 @@ class TestPoomsaeRingSequence:
         div = db.session.get(Division, div_id)
         assert div.ring_sequence is None
 
-    def test_ring_assignment_invalid_ring_sequence(self, client):
-        ring_id = _create_ring(client, "Ring 1").get_json()["id"]
+    def test_ring_assignment_invalid_ring_sequence(self, client, ring_id):
         div_id = _create_division(client, "Poomsae Div", "poomsae").get_json()["id"]
 
         resp = client.patch(
@@ -2616,8 +2653,7 @@ class TestPoomsaeRingSequence:
         )
         assert resp.status_code == 400
 
-    def test_poomsae_divisions_ordered_by_ring_sequence(self, client):
-        ring_id = _create_ring(client, "Ring 1").get_json()["id"]
+    def test_poomsae_divisions_ordered_by_ring_sequence(self, client, ring_id):
         div_a = _create_division(client, "Division A", "poomsae").get_json()["id"]
         div_b = _create_division(client, "Division B", "poomsae").get_json()["id"]
         div_c = _create_division(client, "Division C", "poomsae").get_json()["id"]
@@ -2641,9 +2677,8 @@ class TestPoomsaeRingSequence:
         # B(1) < C(2) < A(3)
         assert html.find("Division B") < html.find("Division C") < html.find("Division A")
 
-    def test_poomsae_divisions_no_sequence_sorted_last(self, client):
+    def test_poomsae_divisions_no_sequence_sorted_last(self, client, ring_id):
         """Divisions without ring_sequence appear after sequenced ones."""
-        ring_id = _create_ring(client, "Ring 1").get_json()["id"]
         div_a = _create_division(client, "AAA No Seq", "poomsae").get_json()["id"]
         div_b = _create_division(client, "BBB Seq 1", "poomsae").get_json()["id"]
 
@@ -2732,9 +2767,8 @@ class TestPoomsaeScorekeeperStatus:
         assert b"Complete" in resp.data   # "Complete" and "Reset" buttons shown
         assert b"Reset" in resp.data
 
-    def test_scorekeeper_fragment_shows_status_buttons(self, client):
+    def test_scorekeeper_fragment_shows_status_buttons(self, client, ring_id):
         """poomsae_divisions fragment shows status update buttons in scorekeeper mode."""
-        ring_id = _create_ring(client, "Ring 1").get_json()["id"]
         div_id = _create_division(client, "Poomsae Div", "poomsae").get_json()["id"]
         _set_poomsae_style(client, div_id, "group")
 
@@ -3102,18 +3136,15 @@ class TestGroupResultsPage:
         assert f"/ui/divisions/{div_id}/bracket".encode() in resp.data
         assert f"/admin/divisions/{div_id}/group_results".encode() not in resp.data
 
-    def test_results_divisions_kyorugi_still_links_to_bracket(self, client):
-        div_id = _create_division(client, "Kyorugi Div", "kyorugi").get_json()["id"]
-        _add_competitors(client, div_id, ["Alice", "Bob"])
-        _generate_bracket(client, div_id)
+    def test_results_divisions_kyorugi_still_links_to_bracket(self, client, make_bracket_division):
+        div_id = make_bracket_division(["Alice", "Bob"], "Kyorugi Div", "kyorugi")
 
         resp = client.get("/ui/results_divisions?event_type=kyorugi")
         assert resp.status_code == 200
         assert f"/ui/divisions/{div_id}/bracket".encode() in resp.data
 
-    def test_results_divisions_poomsae_status_uses_event_status(self, client):
+    def test_results_divisions_poomsae_status_uses_event_status(self, client, ring_id):
         div_id = _create_division(client, "Poomsae Div", "poomsae").get_json()["id"]
-        ring_id = _create_ring(client, "Ring 1").get_json()["id"]
 
         # Default status should be Pending
         resp = client.get("/ui/results_divisions?event_type=poomsae")
@@ -3131,8 +3162,7 @@ class TestGroupResultsPage:
 class TestPoomsaePublicRings:
     """Tests for the public rings live view with poomsae division assignments."""
 
-    def test_poomsae_divisions_appear_on_assigned_ring(self, client):
-        ring_id = _create_ring(client, "Ring 1").get_json()["id"]
+    def test_poomsae_divisions_appear_on_assigned_ring(self, client, ring_id):
         div_id = _create_division(client, "World Class Poomsae", "poomsae").get_json()["id"]
 
         client.patch(
@@ -3153,8 +3183,7 @@ class TestPoomsaePublicRings:
         assert resp.status_code == 200
         assert b"Unassigned Poomsae" not in resp.data
 
-    def test_poomsae_division_not_shown_in_kyorugi_view(self, client):
-        ring_id = _create_ring(client, "Ring 1").get_json()["id"]
+    def test_poomsae_division_not_shown_in_kyorugi_view(self, client, ring_id):
         div_id = _create_division(client, "World Class Poomsae", "poomsae").get_json()["id"]
 
         client.patch(
@@ -3166,8 +3195,7 @@ class TestPoomsaePublicRings:
         assert resp.status_code == 200
         assert b"World Class Poomsae" not in resp.data
 
-    def test_poomsae_division_links_to_results_in_live_view(self, client):
-        ring_id = _create_ring(client, "Ring 1").get_json()["id"]
+    def test_poomsae_division_links_to_results_in_live_view(self, client, ring_id):
         div_id = _create_division(client, "Poomsae Div", "poomsae").get_json()["id"]
 
         client.patch(
@@ -3179,9 +3207,8 @@ class TestPoomsaePublicRings:
         assert resp.status_code == 200
         assert f"/admin/divisions/{div_id}/group_results".encode() in resp.data
 
-    def test_poomsae_live_view_limits_pending_group_divisions_to_three(self, client):
+    def test_poomsae_live_view_limits_pending_group_divisions_to_three(self, client, ring_id):
         """Only the first 3 Pending group divisions (by sequence) appear in the live view."""
-        ring_id = _create_ring(client, "Ring 1").get_json()["id"]
         div_ids = []
         for i in range(5):
             d = _create_division(client, f"Poomsae Div {i + 1}", "poomsae").get_json()["id"]
@@ -3201,9 +3228,8 @@ class TestPoomsaePublicRings:
         assert "Poomsae Div 4" not in body
         assert "Poomsae Div 5" not in body
 
-    def test_poomsae_live_view_shows_in_progress_plus_three_pending(self, client):
+    def test_poomsae_live_view_shows_in_progress_plus_three_pending(self, client, ring_id):
         """An In Progress division counts as the 1 in-progress slot; only 3 Pending remain."""
-        ring_id = _create_ring(client, "Ring 1").get_json()["id"]
         div_ids = []
         for i in range(5):
             d = _create_division(client, f"Poomsae Div {i + 1}", "poomsae").get_json()["id"]
@@ -3224,9 +3250,8 @@ class TestPoomsaePublicRings:
         assert "Poomsae Div 4" in body
         assert "Poomsae Div 5" not in body
 
-    def test_poomsae_live_view_shows_last_completed_group_division(self, client):
+    def test_poomsae_live_view_shows_last_completed_group_division(self, client, ring_id):
         """The most recently completed group division appears as the last-completed item."""
-        ring_id = _create_ring(client, "Ring 1").get_json()["id"]
         comp_div = _create_division(client, "Completed Poomsae", "poomsae").get_json()["id"]
         pend_div = _create_division(client, "Pending Poomsae", "poomsae").get_json()["id"]
 
@@ -3336,10 +3361,8 @@ class TestPoomsaePublicRings:
         group_idx = body.index("Group Poomsae")
         assert "Bracket Poomsae" not in body[:group_idx]
 
-    def test_poomsae_live_view_sequence_order_preserved_in_capped_list(self, client):
+    def test_poomsae_live_view_sequence_order_preserved_in_capped_list(self, client, ring_id):
         """After capping, items must remain in sequence order (not In Progress first)."""
-        ring_id = _create_ring(client, "Ring 1").get_json()["id"]
-
         # Pending at seq 1, In Progress at seq 2, two more Pending at seq 3 and 4
         statuses = ["Pending", "In Progress", "Pending", "Pending"]
         for i, status in enumerate(statuses):
@@ -3362,15 +3385,12 @@ class TestPoomsaePublicRings:
 class TestPoomsaeScorekeeperDivisions:
     """Tests for the poomsae divisions section in the scorekeeper."""
 
-    def test_poomsae_divisions_fragment_empty(self, client):
-        ring_id = _create_ring(client, "Ring 1").get_json()["id"]
-
+    def test_poomsae_divisions_fragment_empty(self, client, ring_id):
         resp = client.get(f"/ui/rings/{ring_id}/poomsae_divisions")
         assert resp.status_code == 200
         assert b"No poomsae divisions" in resp.data
 
-    def test_poomsae_divisions_fragment_shows_assigned(self, client):
-        ring_id = _create_ring(client, "Ring 1").get_json()["id"]
+    def test_poomsae_divisions_fragment_shows_assigned(self, client, ring_id):
         div_id = _create_division(client, "World Class Poomsae", "poomsae").get_json()["id"]
         _add_competitors(client, div_id, ["Alice", "Bob"])
         _set_poomsae_style(client, div_id, "group")
@@ -3386,16 +3406,12 @@ class TestPoomsaeScorekeeperDivisions:
         assert b"Alice" in resp.data
         assert b"Bob" in resp.data
 
-    def test_poomsae_scorekeeper_page_has_divisions_container(self, client):
-        ring_id = _create_ring(client, "Ring 1").get_json()["id"]
-
+    def test_poomsae_scorekeeper_page_has_divisions_container(self, client, ring_id):
         resp = client.get(f"/ring/{ring_id}/scorekeeper?event_type=poomsae")
         assert resp.status_code == 200
         assert b"poomsae-divisions-container" in resp.data
 
-    def test_kyorugi_scorekeeper_page_no_poomsae_container(self, client):
-        ring_id = _create_ring(client, "Ring 1").get_json()["id"]
-
+    def test_kyorugi_scorekeeper_page_no_poomsae_container(self, client, ring_id):
         resp = client.get(f"/ring/{ring_id}/scorekeeper?event_type=kyorugi")
         assert resp.status_code == 200
         assert b"poomsae-divisions-container" not in resp.data
@@ -3658,9 +3674,8 @@ class TestPoomsaeUnifiedRingOrder:
     """Tests that bracket poomsae matches and group poomsae divisions are ordered
     together using the same 1-99 ring sequence number pool."""
 
-    def test_ring_sequence_out_of_range_high(self, client):
+    def test_ring_sequence_out_of_range_high(self, client, ring_id):
         """ring_sequence > 99 is rejected."""
-        ring_id = _create_ring(client, "Ring 1").get_json()["id"]
         div_id = _create_division(client, "Poomsae Div", "poomsae").get_json()["id"]
         _set_poomsae_style(client, div_id, "group")
 
@@ -3670,9 +3685,8 @@ class TestPoomsaeUnifiedRingOrder:
         )
         assert resp.status_code == 400
 
-    def test_ring_sequence_out_of_range_zero(self, client):
+    def test_ring_sequence_out_of_range_zero(self, client, ring_id):
         """ring_sequence = 0 is rejected."""
-        ring_id = _create_ring(client, "Ring 1").get_json()["id"]
         div_id = _create_division(client, "Poomsae Div", "poomsae").get_json()["id"]
         _set_poomsae_style(client, div_id, "group")
 
@@ -3682,9 +3696,8 @@ class TestPoomsaeUnifiedRingOrder:
         )
         assert resp.status_code == 400
 
-    def test_ring_sequence_boundary_values(self, client):
+    def test_ring_sequence_boundary_values(self, client, ring_id):
         """ring_sequence = 1 and ring_sequence = 99 are both accepted."""
-        ring_id = _create_ring(client, "Ring 1").get_json()["id"]
         div_a = _create_division(client, "Div A", "poomsae").get_json()["id"]
         div_b = _create_division(client, "Div B", "poomsae").get_json()["id"]
         _set_poomsae_style(client, div_a, "group")
@@ -3705,9 +3718,8 @@ class TestPoomsaeUnifiedRingOrder:
         assert db.session.get(Division, div_a).ring_sequence == 1
         assert db.session.get(Division, div_b).ring_sequence == 99
 
-    def test_bracket_match_appears_in_poomsae_divisions_fragment(self, client):
+    def test_bracket_match_appears_in_poomsae_divisions_fragment(self, client, ring_id):
         """Bracket-style poomsae matches show up in the unified poomsae_divisions fragment."""
-        ring_id = _create_ring(client, "Ring 1").get_json()["id"]
         div_id = _create_division(client, "Bracket Poomsae", "poomsae").get_json()["id"]
         _add_competitors(client, div_id, ["Alice", "Bob"])
         _set_poomsae_style(client, div_id, "bracket")
@@ -3722,10 +3734,8 @@ class TestPoomsaeUnifiedRingOrder:
         assert resp.status_code == 200
         assert b"Bracket Poomsae" in resp.data
 
-    def test_bracket_match_and_group_division_interleaved_by_sequence(self, client):
+    def test_bracket_match_and_group_division_interleaved_by_sequence(self, client, ring_id):
         """Bracket match (seq=5) and group division (seq=3) interleave correctly."""
-        ring_id = _create_ring(client, "Ring 1").get_json()["id"]
-
         # Bracket poomsae match at sequence 5
         div_bracket = _create_division(client, "Bracket Poomsae", "poomsae").get_json()["id"]
         _add_competitors(client, div_bracket, ["Alice", "Bob"])
@@ -3750,10 +3760,8 @@ class TestPoomsaeUnifiedRingOrder:
         # Group Poomsae (seq=3) should appear before Bracket Poomsae (seq=5)
         assert html.find("Group Poomsae") < html.find("Bracket Poomsae")
 
-    def test_unsequenced_group_division_sorted_after_bracket_match(self, client):
+    def test_unsequenced_group_division_sorted_after_bracket_match(self, client, ring_id):
         """Unsequenced group division appears after bracket match with a sequence number."""
-        ring_id = _create_ring(client, "Ring 1").get_json()["id"]
-
         # Bracket match at sequence 1
         div_bracket = _create_division(client, "Bracket First", "poomsae").get_json()["id"]
         _add_competitors(client, div_bracket, ["Alice", "Bob"])
@@ -3788,10 +3796,8 @@ class TestPoomsaeUnifiedRingOrder:
         assert b'id="matches-container"' in resp.data
         assert b'display:none' in resp.data
 
-    def test_kyorugi_scorekeeper_uses_matches_container(self, client):
+    def test_kyorugi_scorekeeper_uses_matches_container(self, client, ring_id):
         """Kyorugi scorekeeper still uses the standard matches-container."""
-        ring_id = _create_ring(client, "Ring 1").get_json()["id"]
-
         resp = client.get(f"/ring/{ring_id}/scorekeeper?event_type=kyorugi")
         assert resp.status_code == 200
         # No hidden matches-container
@@ -3808,10 +3814,8 @@ class TestPoomsaeLiveViewOrdering:
     """Tests that group divisions and bracket matches are interleaved by sequence
     in the public rings live view, and that bracket-style divisions are excluded."""
 
-    def test_group_division_appears_before_bracket_match_by_sequence(self, client):
+    def test_group_division_appears_before_bracket_match_by_sequence(self, client, ring_id):
         """Group division at seq=2 appears before bracket match at seq=5 in live view."""
-        ring_id = _create_ring(client, "Ring 1").get_json()["id"]
-
         # Bracket poomsae match at sequence 5
         div_bracket = _create_division(client, "Bracket Div", "poomsae").get_json()["id"]
         _add_competitors(client, div_bracket, ["Alice", "Bob"])
@@ -3835,11 +3839,9 @@ class TestPoomsaeLiveViewOrdering:
         # Group Div (seq=2) should appear before Bracket Div (seq=5)
         assert html.find("Group Div") < html.find("Bracket Div")
 
-    def test_bracket_style_division_excluded_from_live_view_divisions_loop(self, client):
+    def test_bracket_style_division_excluded_from_live_view_divisions_loop(self, client, ring_id):
         """A bracket-style poomsae division doesn't appear in the divisions section
         of the live view (it shows via its scheduled matches instead)."""
-        ring_id = _create_ring(client, "Ring 1").get_json()["id"]
-
         div_bracket = _create_division(client, "Only Bracket", "poomsae").get_json()["id"]
         _set_poomsae_style(client, div_bracket, "bracket")
 
@@ -3855,10 +3857,8 @@ class TestPoomsaeLiveViewOrdering:
         # (it would only appear via a scheduled match; no match here so absent)
         assert b"Only Bracket" not in resp.data
 
-    def test_unsequenced_group_division_sorted_last_in_live_view(self, client):
+    def test_unsequenced_group_division_sorted_last_in_live_view(self, client, ring_id):
         """Group division without sequence appears after bracket match with sequence."""
-        ring_id = _create_ring(client, "Ring 1").get_json()["id"]
-
         # Bracket match at seq 1
         div_bracket = _create_division(client, "Bracket First", "poomsae").get_json()["id"]
         _add_competitors(client, div_bracket, ["Alice", "Bob"])
@@ -3886,11 +3886,9 @@ class TestPoomsaeSequenceConflictPrevention:
     """Tests that group divisions and bracket matches cannot share the same
     ring sequence number."""
 
-    def test_bracket_match_blocked_by_existing_group_division_sequence(self, client):
+    def test_bracket_match_blocked_by_existing_group_division_sequence(self, client, ring_id):
         """Scheduling a bracket match at a sequence occupied by a group division returns
         a conflict error (HTTP 200 with error HTML, per the bracket scheduling pattern)."""
-        ring_id = _create_ring(client, "Ring 1").get_json()["id"]
-
         # Group division at sequence 5
         div_group = _create_division(client, "Group Div", "poomsae").get_json()["id"]
         _set_poomsae_style(client, div_group, "group")
@@ -3919,10 +3917,8 @@ class TestPoomsaeSequenceConflictPrevention:
         db.session.refresh(match)
         assert match.match_number is None
 
-    def test_group_division_blocked_by_existing_bracket_match_sequence(self, client):
+    def test_group_division_blocked_by_existing_bracket_match_sequence(self, client, ring_id):
         """Assigning a group division to a sequence occupied by a bracket match returns 400."""
-        ring_id = _create_ring(client, "Ring 1").get_json()["id"]
-
         # Bracket match at sequence 3
         div_bracket = _create_division(client, "Bracket Div", "poomsae").get_json()["id"]
         _add_competitors(client, div_bracket, ["Alice", "Bob"])
@@ -3942,10 +3938,8 @@ class TestPoomsaeSequenceConflictPrevention:
         assert resp.status_code == 400
         assert b"already used" in resp.data
 
-    def test_two_group_divisions_cannot_share_same_sequence_in_ring(self, client):
+    def test_two_group_divisions_cannot_share_same_sequence_in_ring(self, client, ring_id):
         """Two group divisions in the same ring cannot both use the same ring_sequence."""
-        ring_id = _create_ring(client, "Ring 1").get_json()["id"]
-
         div_a = _create_division(client, "Group A", "poomsae").get_json()["id"]
         div_b = _create_division(client, "Group B", "poomsae").get_json()["id"]
         _set_poomsae_style(client, div_a, "group")
@@ -3983,9 +3977,8 @@ class TestPoomsaeSequenceConflictPrevention:
         assert resp_a.status_code == 200
         assert resp_b.status_code == 200
 
-    def test_division_can_keep_its_own_sequence_when_reassigning(self, client):
+    def test_division_can_keep_its_own_sequence_when_reassigning(self, client, ring_id):
         """A group division can be saved again with the same ring_sequence it already holds."""
-        ring_id = _create_ring(client, "Ring 1").get_json()["id"]
         div_id = _create_division(client, "Group Div", "poomsae").get_json()["id"]
         _set_poomsae_style(client, div_id, "group")
 
@@ -4059,33 +4052,29 @@ class TestCompletedGroupDivisionVisibility:
         )
         return div_id
 
-    def test_completed_group_hidden_from_scorekeeper(self, client):
-        ring_id = _create_ring(client, "Ring 1").get_json()["id"]
+    def test_completed_group_hidden_from_scorekeeper(self, client, ring_id):
         div_id = self._setup_group_division(client, ring_id, "Done Poomsae", seq=1, status="Completed")
 
         resp = client.get(f"/ui/rings/{ring_id}/poomsae_divisions")
         assert resp.status_code == 200
         assert b"Done Poomsae" not in resp.data
 
-    def test_in_progress_group_shown_in_scorekeeper(self, client):
-        ring_id = _create_ring(client, "Ring 1").get_json()["id"]
+    def test_in_progress_group_shown_in_scorekeeper(self, client, ring_id):
         self._setup_group_division(client, ring_id, "Active Poomsae", seq=1, status="In Progress")
 
         resp = client.get(f"/ui/rings/{ring_id}/poomsae_divisions")
         assert resp.status_code == 200
         assert b"Active Poomsae" in resp.data
 
-    def test_pending_group_shown_in_scorekeeper(self, client):
-        ring_id = _create_ring(client, "Ring 1").get_json()["id"]
+    def test_pending_group_shown_in_scorekeeper(self, client, ring_id):
         self._setup_group_division(client, ring_id, "Pending Poomsae", seq=1, status="Pending")
 
         resp = client.get(f"/ui/rings/{ring_id}/poomsae_divisions")
         assert resp.status_code == 200
         assert b"Pending Poomsae" in resp.data
 
-    def test_completing_via_status_route_clears_scorekeeper(self, client):
+    def test_completing_via_status_route_clears_scorekeeper(self, client, ring_id):
         """After PATCH event_status → Completed the scorekeeper fragment no longer shows the division."""
-        ring_id = _create_ring(client, "Ring 1").get_json()["id"]
         div_id = self._setup_group_division(client, ring_id, "Will Complete", seq=2, status="In Progress")
 
         # Mark completed
@@ -4095,9 +4084,8 @@ class TestCompletedGroupDivisionVisibility:
         html = resp.data.decode()
         assert "Will Complete" not in html
 
-    def test_completed_group_shown_as_last_completed_in_live_view(self, client):
+    def test_completed_group_shown_as_last_completed_in_live_view(self, client, ring_id):
         """The most recently completed group division is shown as the last-completed event."""
-        ring_id = _create_ring(client, "Ring 1").get_json()["id"]
         self._setup_group_division(client, ring_id, "Finished Group", seq=1, status="Completed")
 
         resp = client.get("/ui/public_rings?event_type=poomsae")
@@ -4106,8 +4094,7 @@ class TestCompletedGroupDivisionVisibility:
         assert "Finished Group" in body
         assert "status-completed" in body
 
-    def test_non_completed_group_shown_in_live_view(self, client):
-        ring_id = _create_ring(client, "Ring 1").get_json()["id"]
+    def test_non_completed_group_shown_in_live_view(self, client, ring_id):
         self._setup_group_division(client, ring_id, "Running Group", seq=1, status="In Progress")
 
         resp = client.get("/ui/public_rings?event_type=poomsae")
@@ -4189,15 +4176,12 @@ class TestMatchAnalytics:
     # _collect_match_durations
     # ------------------------------------------------------------------
 
-    def test_collect_match_durations_returns_timed_matches(self, client):
+    def test_collect_match_durations_returns_timed_matches(self, client, ring_id, make_bracket_division):
         from datetime import datetime, timedelta, timezone
 
         from scripts.match_analytics import _collect_match_durations
 
-        ring_id = _create_ring(client, "Ring 1").get_json()["id"]
-        div_id = _create_division(client, "Kyorugi Div", "kyorugi").get_json()["id"]
-        _add_competitors(client, div_id, ["Alice", "Bob"])
-        _generate_bracket(client, div_id)
+        div_id = make_bracket_division(["Alice", "Bob"], "Kyorugi Div", "kyorugi")
 
         match = Match.query.filter_by(division_id=div_id).first()
         match.ring_id = ring_id
@@ -4211,25 +4195,21 @@ class TestMatchAnalytics:
         assert rows[0]["ring_name"] == "Ring 1"
         assert rows[0]["duration"] == timedelta(minutes=2, seconds=30)
 
-    def test_collect_match_durations_excludes_untimed(self, client):
+    def test_collect_match_durations_excludes_untimed(self, client, make_bracket_division):
         from scripts.match_analytics import _collect_match_durations
 
-        div_id = _create_division(client, "Kyorugi Div", "kyorugi").get_json()["id"]
-        _add_competitors(client, div_id, ["Alice", "Bob"])
-        _generate_bracket(client, div_id)
+        div_id = make_bracket_division(["Alice", "Bob"], "Kyorugi Div", "kyorugi")
         # No start/end times set
 
         rows = _collect_match_durations()
         assert rows == []
 
-    def test_collect_match_durations_excludes_zero_duration(self, client):
+    def test_collect_match_durations_excludes_zero_duration(self, client, make_bracket_division):
         from datetime import datetime, timezone
 
         from scripts.match_analytics import _collect_match_durations
 
-        div_id = _create_division(client, "Kyorugi Div", "kyorugi").get_json()["id"]
-        _add_competitors(client, div_id, ["Alice", "Bob"])
-        _generate_bracket(client, div_id)
+        div_id = make_bracket_division(["Alice", "Bob"], "Kyorugi Div", "kyorugi")
 
         match = Match.query.filter_by(division_id=div_id).first()
         same_time = datetime(2024, 1, 1, 10, 0, 0, tzinfo=timezone.utc)
@@ -4240,14 +4220,12 @@ class TestMatchAnalytics:
         rows = _collect_match_durations()
         assert rows == []
 
-    def test_collect_match_durations_unassigned_ring(self, client):
+    def test_collect_match_durations_unassigned_ring(self, client, make_bracket_division):
         from datetime import datetime, timezone
 
         from scripts.match_analytics import _collect_match_durations
 
-        div_id = _create_division(client, "Kyorugi Div", "kyorugi").get_json()["id"]
-        _add_competitors(client, div_id, ["Alice", "Bob"])
-        _generate_bracket(client, div_id)
+        div_id = make_bracket_division(["Alice", "Bob"], "Kyorugi Div", "kyorugi")
 
         match = Match.query.filter_by(division_id=div_id).first()
         match.start_time = datetime(2024, 1, 1, 10, 0, 0, tzinfo=timezone.utc)
@@ -4262,12 +4240,11 @@ class TestMatchAnalytics:
     # _collect_division_durations
     # ------------------------------------------------------------------
 
-    def test_collect_division_durations_returns_timed_group_divisions(self, client):
+    def test_collect_division_durations_returns_timed_group_divisions(self, client, ring_id):
         from datetime import datetime, timedelta, timezone
 
         from scripts.match_analytics import _collect_division_durations
 
-        ring_id = _create_ring(client, "Ring 1").get_json()["id"]
         div_id = _create_division(client, "Poomsae Group", "poomsae").get_json()["id"]
         _set_poomsae_style(client, div_id, "group")
 
@@ -4341,15 +4318,12 @@ class TestMatchAnalytics:
     # main() — with data
     # ------------------------------------------------------------------
 
-    def test_main_with_match_data(self, client, capsys):
+    def test_main_with_match_data(self, client, capsys, ring_id, make_bracket_division):
         from datetime import datetime, timezone
 
         from scripts.match_analytics import main
 
-        ring_id = _create_ring(client, "Ring 1").get_json()["id"]
-        div_id = _create_division(client, "Kyorugi Div", "kyorugi").get_json()["id"]
-        _add_competitors(client, div_id, ["Alice", "Bob"])
-        _generate_bracket(client, div_id)
+        div_id = make_bracket_division(["Alice", "Bob"], "Kyorugi Div", "kyorugi")
 
         match = Match.query.filter_by(division_id=div_id).first()
         match.ring_id = ring_id
@@ -4363,12 +4337,11 @@ class TestMatchAnalytics:
         assert "Ring 1" in out
         assert "2:00" in out
 
-    def test_main_with_division_data(self, client, capsys):
+    def test_main_with_division_data(self, client, capsys, ring_id):
         from datetime import datetime, timezone
 
         from scripts.match_analytics import main
 
-        ring_id = _create_ring(client, "Ring 1").get_json()["id"]
         div_id = _create_division(client, "Poomsae Group", "poomsae").get_json()["id"]
         _set_poomsae_style(client, div_id, "group")
 
@@ -4422,17 +4395,14 @@ class TestMatchAnalytics:
         # No data: should print the no-data message, not CSV headers
         assert "No timed event data found" in out
 
-    def test_main_csv_with_match_data(self, client, capsys):
+    def test_main_csv_with_match_data(self, client, capsys, ring_id, make_bracket_division):
         import csv
         import io
         from datetime import datetime, timezone
 
         from scripts.match_analytics import main
 
-        ring_id = _create_ring(client, "Ring 1").get_json()["id"]
-        div_id = _create_division(client, "Kyorugi Div", "kyorugi").get_json()["id"]
-        _add_competitors(client, div_id, ["Alice", "Bob"])
-        _generate_bracket(client, div_id)
+        div_id = make_bracket_division(["Alice", "Bob"], "Kyorugi Div", "kyorugi")
 
         match = Match.query.filter_by(division_id=div_id).first()
         match.ring_id = ring_id
@@ -4458,15 +4428,12 @@ class TestMatchAnalytics:
         ring_row = next(r for r in rows if r["group"] == "by_ring")
         assert ring_row["category"] == "Ring 1"
 
-    def test_main_csv_headers(self, client, capsys):
+    def test_main_csv_headers(self, client, capsys, ring_id, make_bracket_division):
         from datetime import datetime, timezone
 
         from scripts.match_analytics import main
 
-        ring_id = _create_ring(client, "Ring 1").get_json()["id"]
-        div_id = _create_division(client, "Kyorugi Div", "kyorugi").get_json()["id"]
-        _add_competitors(client, div_id, ["Alice", "Bob"])
-        _generate_bracket(client, div_id)
+        div_id = make_bracket_division(["Alice", "Bob"], "Kyorugi Div", "kyorugi")
 
         match = Match.query.filter_by(division_id=div_id).first()
         match.ring_id = ring_id
@@ -4495,16 +4462,13 @@ class TestMatchAnalytics:
         # No data: should print the no-data message, not JSON
         assert "No timed event data found" in out
 
-    def test_main_json_with_match_data(self, client, capsys):
+    def test_main_json_with_match_data(self, client, capsys, ring_id, make_bracket_division):
         import json
         from datetime import datetime, timezone
 
         from scripts.match_analytics import main
 
-        ring_id = _create_ring(client, "Ring 1").get_json()["id"]
-        div_id = _create_division(client, "Kyorugi Div", "kyorugi").get_json()["id"]
-        _add_competitors(client, div_id, ["Alice", "Bob"])
-        _generate_bracket(client, div_id)
+        div_id = make_bracket_division(["Alice", "Bob"], "Kyorugi Div", "kyorugi")
 
         match = Match.query.filter_by(division_id=div_id).first()
         match.ring_id = ring_id
@@ -4532,13 +4496,12 @@ class TestMatchAnalytics:
         assert len(ring_entries) == 1
         assert ring_entries[0]["category"] == "Ring 1"
 
-    def test_main_json_with_division_data(self, client, capsys):
+    def test_main_json_with_division_data(self, client, capsys, ring_id):
         import json
         from datetime import datetime, timezone
 
         from scripts.match_analytics import main
 
-        ring_id = _create_ring(client, "Ring 1").get_json()["id"]
         div_id = _create_division(client, "Poomsae Group", "poomsae").get_json()["id"]
         _set_poomsae_style(client, div_id, "group")
 
@@ -4557,16 +4520,14 @@ class TestMatchAnalytics:
         assert event_entries[0]["avg_seconds"] == 180
         assert event_entries[0]["longest_formatted"] == "3:00"
 
-    def test_main_json_is_valid_json(self, client, capsys):
+    def test_main_json_is_valid_json(self, client, capsys, make_bracket_division):
         """JSON output must always be parseable regardless of data."""
         import json
         from datetime import datetime, timezone
 
         from scripts.match_analytics import main
 
-        div_id = _create_division(client, "Kyorugi Div", "kyorugi").get_json()["id"]
-        _add_competitors(client, div_id, ["Alice", "Bob"])
-        _generate_bracket(client, div_id)
+        div_id = make_bracket_division(["Alice", "Bob"], "Kyorugi Div", "kyorugi")
 
         match = Match.query.filter_by(division_id=div_id).first()
         match.start_time = datetime(2024, 1, 1, 10, 0, 0, tzinfo=timezone.utc)
@@ -0,0 +1,94 @@
+"""Tests for the scripts/update_secrets.py S3 upload helper."""
+
+import hashlib
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from scripts.update_secrets import main
+
+
+class _ClientError(Exception):
+    """Stand-in for botocore's ClientError, exposed as ``client.exceptions.ClientError``."""
+
+
+def _mock_s3_client(etag=None):
+    """Return a mock S3 client whose ``head_object`` reports *etag*, or a missing object when None."""
+    s3_client = MagicMock()
+    s3_client.exceptions.ClientError = _ClientError
+    if etag is None:
+        s3_client.head_object.side_effect = _ClientError("Not Found")
+    else:
+        s3_client.head_object.return_value = {"ETag": f'"{etag}"'}
+    return s3_client
+
+
+@pytest.fixture
+def secrets_env(monkeypatch, tmp_path):
+    """Run from an empty directory (no <env>.env file) with the secrets set in the environment."""
+    monkeypatch.chdir(tmp_path)
+    values = {
+        "user": "db-user",
+        "password": "db-pass",
+        "host": "db.example.com",
+        "port": "5432",
+        "dbname": "postgres",
+        "SUPABASE_URL": "https://example.supabase.co",
+        "SUPABASE_KEY": "supabase-key",
+        "SECRET_KEY": "secret",
+    }
+    for key, value in values.items():
+        monkeypatch.setenv(key, value)
+    return values
+
+
+def test_uploads_secrets_json_to_env_bucket(secrets_env):
+    s3_client = _mock_s3_client()
+
+    main("dev", s3_client=s3_client)
+
+    s3_client.put_object.assert_called_once()
+    kwargs = s3_client.put_object.call_args.kwargs
+    assert kwargs["Bucket"] == "zappa-tkd-competition-manager-dev"
+    assert kwargs["Key"] == "secrets.json"
+    assert kwargs["ContentType"] == "application/json"
+    assert json.loads(kwargs["Body"]) == secrets_env
+
+
+def test_body_is_compact_json_bytes(secrets_env):
+    s3_client = _mock_s3_client()
+
+    main("dev", s3_client=s3_client)
+
+    body = s3_client.put_object.call_args.kwargs["Body"]
+    assert body == json.dumps(secrets_env, separators=(",", ":")).encode()
+
+
+def test_upload_error_is_reported_not_raised(secrets_env, capsys):
+    s3_client = _mock_s3_client()
+    s3_client.put_object.side_effect = RuntimeError("access denied")
+
+    main("prod", s3_client=s3_client)
+
+    assert "Error uploading object: access denied" in capsys.readouterr().out
+
+
+def test_unchanged_payload_skips_upload(secrets_env, capsys):
+    s3_client = _mock_s3_client()
+    main("dev", s3_client=s3_client)
+    uploaded = s3_client.put_object.call_args.kwargs["Body"]
+
+    s3_client = _mock_s3_client(etag=hashlib.md5(uploaded).hexdigest())
+    main("dev", s3_client=s3_client)
+
+    s3_client.put_object.assert_not_called()
+    assert "unchanged; skipping upload" in capsys.readouterr().out
+
+
+def test_changed_payload_is_uploaded(secrets_env):
+    s3_client = _mock_s3_client(etag="0" * 32)
+
+    main("dev", s3_client=s3_client)
+
+    s3_client.put_object.assert_called_once()